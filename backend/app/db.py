@@ -1,19 +1,356 @@
 from __future__ import annotations
 
+import asyncio
 import aiosqlite
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import itertools
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import os
+import re
+import time
 
 # 獲取當前檔案的目錄路徑，確保資料庫檔案路徑正確
 DB_FILE = os.path.join(os.path.dirname(__file__), "ai_news.db")
 
+# 各語言對應的翻譯欄位（標題, 摘要）
+LANGUAGE_COLUMNS = {
+    "zh_tw": ("title_zh_tw", "summary_zh_tw"),
+    "zh_cn": ("title_zh_cn", "summary_zh_cn"),
+    "en": ("title_en", "summary_en"),
+}
 
-async def _migrate_published_column(db: aiosqlite.Connection) -> None:
+
+# 各語言在 translation_mask 欄位中對應的位元（該位元為 1 代表已有此語言的翻譯標題）
+TRANSLATION_BITS = {
+    "zh_tw": 1,
+    "zh_cn": 2,
+    "en": 4,
+}
+
+# 所有語言皆已翻譯時的 translation_mask
+FULLY_TRANSLATED_MASK = sum(TRANSLATION_BITS.values())
+
+# 資料版本號：每次提交文章資料的變更後遞增，供 API 層判斷快取的回應是否仍有效
+_data_version = 0
+
+
+def get_data_version() -> int:
+    """
+    獲取目前的資料版本號
+    
+    Returns:
+        資料版本號（版本號相同代表文章資料自上次讀取後沒有變更）
+    """
+    return _data_version
+
+
+def _bump_data_version() -> None:
+    """
+    在提交文章資料的變更後遞增資料版本號
+    """
+    global _data_version
+    _data_version += 1
+
+
+# 寫入鎖：寫入連線上的交易是共享的，寫入必須序列化以免互相提交對方的半成品
+_write_lock = asyncio.Lock()
+
+# 連線建立時套用的 PRAGMA：
+# - WAL 讓讀取與寫入可以同時進行
+# - synchronous=NORMAL 在 WAL 下每次提交不再 fsync
+# - 暫存表放記憶體、64MB 頁面快取、256MB mmap
+# - 資料庫被其他連線（如手動維護的 sqlite3 CLI）鎖住時最多等待 5 秒，而不是立即回報 SQLITE_BUSY
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# 唯讀連線額外套用的 PRAGMA（journal_mode 由寫入連線設定後即保存在資料庫檔案中）
+_READER_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# 唯讀連線數量：每條 aiosqlite 連線各自擁有一條背景執行緒
+_READER_COUNT = min(4, os.cpu_count() or 1)
+
+# 每條連線的已編譯語句快取容量（sqlite3 以 SQL 文字為鍵重用已編譯的語句）。
+# 查詢語句皆為模組常數，只需容納所有固定 SQL 以及各 IN 查詢的批次長度；
+# 不在多個協程間共用 cursor，因為共用連線上的 cursor 無法同時執行兩個查詢
+_STATEMENT_CACHE_SIZE = 256
+
+
+class _ConnPool:
+    """
+    SQLite 連線池：一條寫入連線加上數條唯讀連線
+    
+    WAL 模式下讀取不會被寫入阻擋，讀取走獨立的連線（及其執行緒），
+    讓 /api/articles 在 /api/refresh 寫入期間仍可同時回應
+    """
+    
+    def __init__(self, reader_count: int):
+        self._reader_count = reader_count
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_cycle: Optional[itertools.cycle] = None
+        self._open_lock = asyncio.Lock()
+        self._cycle_lock = asyncio.Lock()
+    
+    async def writer(self) -> aiosqlite.Connection:
+        """
+        獲取寫入連線（首次呼叫時建立）
+        """
+        if self._writer is not None:
+            return self._writer
+        
+        async with self._open_lock:
+            if self._writer is None:
+                conn = await aiosqlite.connect(DB_FILE, cached_statements=_STATEMENT_CACHE_SIZE)
+                conn.row_factory = aiosqlite.Row
+                for pragma in _CONNECTION_PRAGMAS:
+                    await conn.execute(pragma)
+                await conn.commit()
+                # 讓遷移在 SQL 內直接標準化時間，不必把資料逐列搬到 Python
+                await conn.create_function("normalize_ts", 1, _standardize_time_string, deterministic=True)
+                await conn.create_function("published_epoch", 1, _published_to_epoch, deterministic=True)
+                self._writer = conn
+            return self._writer
+    
+    async def reader(self) -> aiosqlite.Connection:
+        """
+        以輪詢方式獲取一條唯讀連線（首次呼叫時建立全部唯讀連線）
+        """
+        if self._reader_cycle is None:
+            # 先確保寫入連線已將資料庫切換為 WAL
+            await self.writer()
+            async with self._open_lock:
+                if self._reader_cycle is None:
+                    for _ in range(self._reader_count):
+                        conn = await aiosqlite.connect(DB_FILE, cached_statements=_STATEMENT_CACHE_SIZE)
+                        conn.row_factory = aiosqlite.Row
+                        for pragma in _READER_PRAGMAS:
+                            await conn.execute(pragma)
+                        self._readers.append(conn)
+                    self._reader_cycle = itertools.cycle(self._readers)
+        
+        async with self._cycle_lock:
+            return next(self._reader_cycle)
+    
+    async def close(self) -> None:
+        """
+        關閉所有連線
+        """
+        async with self._open_lock:
+            for conn in self._readers:
+                await conn.close()
+            self._readers = []
+            self._reader_cycle = None
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+
+
+_pool = _ConnPool(_READER_COUNT)
+
+
+async def get_db() -> aiosqlite.Connection:
+    """
+    獲取共用的寫入連線（首次呼叫時建立）
+    
+    Returns:
+        共用的 aiosqlite 寫入連線
+    """
+    return await _pool.writer()
+
+
+async def _get_reader() -> aiosqlite.Connection:
+    """
+    獲取唯讀連線，供不寫入的查詢使用
+    
+    Returns:
+        設定為 query_only 的 aiosqlite 連線
+    """
+    return await _pool.reader()
+
+
+async def close_db() -> None:
+    """
+    關閉所有資料庫連線（應用程式關閉時呼叫）
+    """
+    await _stop_writer()
+    await _pool.close()
+
+
+# 群組提交（group commit）：零散的單筆寫入先排入佇列，由單一寫入工作
+# 把同一時間窗內的寫入放進同一個交易提交，讓多筆寫入共用一次提交
+_GROUP_COMMIT_MAX = 64
+_GROUP_COMMIT_WINDOW = 0.01  # 秒
+
+# 寫入操作：接收連線並在寫入工作開啟的交易中執行，回傳值交給提交者
+# （修改文章資料的操作回傳實際變更的列數或是否有變更，供判斷是否需遞增資料版本號）
+WriteOp = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+_write_queue: Optional[asyncio.Queue] = None
+_writer_task: Optional[asyncio.Task] = None
+
+
+async def _submit_write(op: WriteOp, changes_articles: bool = False) -> Any:
+    """
+    將寫入操作交給寫入工作，並等待其所在的交易提交完成
+    
+    Args:
+        op: 寫入操作
+        changes_articles: 操作是否修改文章資料（是且回傳值為真時，提交後遞增資料版本號）
+        
+    Returns:
+        寫入操作的回傳值
+    """
+    global _write_queue, _writer_task
+    if _writer_task is None or _writer_task.done():
+        _write_queue = asyncio.Queue()
+        _writer_task = asyncio.create_task(_writer_loop(_write_queue))
+    
+    future = asyncio.get_running_loop().create_future()
+    await _write_queue.put((op, future, changes_articles))
+    return await future
+
+
+async def _collect_write_batch(queue: asyncio.Queue) -> List[tuple]:
+    """
+    等待第一筆寫入，再於時間窗內收集後續寫入（已排隊的寫入會全部取出）
+    """
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _GROUP_COMMIT_WINDOW
+    
+    while len(batch) < _GROUP_COMMIT_MAX:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    
+    while not queue.empty():
+        batch.append(queue.get_nowait())
+    return batch
+
+
+async def _writer_loop(queue: asyncio.Queue) -> None:
+    """
+    寫入工作：持續取出寫入操作並整批提交
+    """
+    while True:
+        batch = await _collect_write_batch(queue)
+        try:
+            await _run_write_batch(batch)
+        except Exception as e:
+            # 提交失敗時整批寫入皆未生效
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def _run_write_batch(batch: List[tuple]) -> None:
+    """
+    在單一交易中執行一批寫入操作
+    
+    每個操作以 SAVEPOINT 隔離，單一操作失敗只回滾該操作，不影響同批其他寫入；
+    只有批次中確實修改了文章資料時才遞增資料版本號
+    """
+    db = await get_db()
+    outcomes = []
+    articles_changed = False
+    async with _write_lock:
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            for op, future, changes_articles in batch:
+                await db.execute("SAVEPOINT write_op")
+                try:
+                    result = await op(db)
+                except Exception as e:
+                    await db.execute("ROLLBACK TO write_op")
+                    outcomes.append((future, e, None))
+                else:
+                    outcomes.append((future, None, result))
+                    articles_changed = articles_changed or (changes_articles and bool(result))
+                await db.execute("RELEASE write_op")
+            await db.commit()
+            if articles_changed:
+                _bump_data_version()
+        except Exception:
+            await db.rollback()
+            raise
+    
+    for future, error, result in outcomes:
+        if future.done():
+            continue  # 提交者已取消等待
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+async def _stop_writer() -> None:
+    """
+    等待佇列中的寫入全部提交後停止寫入工作
+    """
+    global _write_queue, _writer_task
+    if _writer_task is None:
+        return
+    
+    if not _writer_task.done():
+        await _write_queue.join()
+        _writer_task.cancel()
+    try:
+        await _writer_task
+    except asyncio.CancelledError:
+        pass
+    _writer_task = None
+    _write_queue = None
+
+
+# 資料庫結構版本（記錄於 PRAGMA user_version），達到此版本即代表遷移與時間標準化皆已完成
+_SCHEMA_VERSION = 2
+
+# 本行程內是否已確認完成遷移，避免重複呼叫 init_db() 時再次檢查
+_MIGRATED = False
+
+
+async def _migrate_published_column(db: aiosqlite.Connection) -> bool:
     """
     遷移published字段從TEXT類型到DATETIME類型，並標準化現有時間數據為RFC 2822格式
+    
+    已記錄為目前結構版本的資料庫直接略過，不再進行全表掃描
+    
+    Returns:
+        True 如果無需遷移或遷移成功，False 如果遷移失敗
     """
+    global _MIGRATED
+    if _MIGRATED:
+        return True
+    
     try:
+        async with db.execute("PRAGMA user_version") as cursor:
+            user_version = (await cursor.fetchone())[0]
+        
+        if user_version >= _SCHEMA_VERSION:
+            _MIGRATED = True
+            return True
+        
         # 檢查表是否存在
         async with db.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='articles'"
@@ -21,7 +358,7 @@ async def _migrate_published_column(db: aiosqlite.Connection) -> None:
             table_exists = await cursor.fetchone()
         
         if not table_exists:
-            return  # 表不存在，無需遷移
+            return True  # 表不存在，無需遷移
         
         # 檢查published字段的類型
         async with db.execute("PRAGMA table_info(articles)") as cursor:
@@ -33,7 +370,7 @@ async def _migrate_published_column(db: aiosqlite.Connection) -> None:
                     break
         
         if not published_column:
-            return  # published字段不存在
+            return True  # published字段不存在
         
         # 如果published字段已經是DATETIME類型，檢查是否需要標準化數據
         if 'DATETIME' in published_column[2].upper():
@@ -46,7 +383,7 @@ async def _migrate_published_column(db: aiosqlite.Connection) -> None:
             if non_standard_count > 0:
                 print(f"發現 {non_standard_count} 條需要標準化的時間記錄，開始更新...")
                 await _standardize_existing_times(db)
-            return
+            return True
         
         print("開始遷移published字段類型從TEXT到DATETIME...")
         
@@ -64,7 +401,8 @@ async def _migrate_published_column(db: aiosqlite.Connection) -> None:
                 title_zh_cn TEXT,
                 summary_zh_cn TEXT,
                 title_en TEXT,
-                summary_en TEXT
+                summary_en TEXT,
+                published_ts INTEGER NOT NULL DEFAULT 0
             )
             """
         )
@@ -77,6 +415,7 @@ async def _migrate_published_column(db: aiosqlite.Connection) -> None:
         await db.execute("ALTER TABLE articles_new RENAME TO articles")
         
         print("published字段類型遷移完成")
+        return True
         
     except Exception as e:
         print(f"遷移過程中發生錯誤: {e}")
@@ -85,123 +424,283 @@ async def _migrate_published_column(db: aiosqlite.Connection) -> None:
             await db.execute("DROP TABLE IF EXISTS articles_new")
         except:
             pass
+        return False
 
 
 async def _migrate_and_standardize_data(db: aiosqlite.Connection) -> None:
     """
     遷移數據並標準化時間格式
-    """
-    import time
-    from datetime import datetime
     
-    async with db.execute("SELECT * FROM articles") as cursor:
-        rows = await cursor.fetchall()
-    
-    migrated_count = 0
-    failed_count = 0
-    
-    for row in rows:
-        try:
-            # 解析舊的時間格式並標準化
-            old_published = row[3]  # published字段在第4列 (index 3)
-            standardized_time = _standardize_time_string(old_published)
-            
-            # 插入到新表
-            await db.execute(
-                """
-                INSERT INTO articles_new (
-                    link, original_title, original_summary, published, feed_source,
-                    title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn,
-                    title_en, summary_en
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row[0], row[1], row[2], standardized_time, row[4],
-                    row[5], row[6], row[7], row[8], row[9], row[10]
-                )
-            )
-            migrated_count += 1
-            
-        except Exception as e:
-            print(f"遷移記錄失敗 {row[0]}: {e}")
-            failed_count += 1
+    整個複製在 SQLite 引擎內以單一 INSERT ... SELECT 完成，
+    時間標準化透過註冊的 normalize_ts / published_epoch 函數執行。
+    """
+    cursor = await db.execute(
+        """
+        INSERT INTO articles_new (
+            link, original_title, original_summary, published, feed_source,
+            title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn,
+            title_en, summary_en, published_ts
+        )
+        SELECT
+            link, original_title, original_summary, normalize_ts(published), feed_source,
+            title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn,
+            title_en, summary_en, published_epoch(normalize_ts(published))
+        FROM articles
+        """
+    )
     
-    print(f"遷移完成: {migrated_count} 成功, {failed_count} 失敗")
+    print(f"遷移完成: {cursor.rowcount} 條記錄")
 
 
 async def _standardize_existing_times(db: aiosqlite.Connection) -> None:
     """
     標準化現有數據庫中的時間格式
     """
-    async with db.execute("SELECT link, published FROM articles WHERE published IS NOT NULL") as cursor:
-        rows = await cursor.fetchall()
+    cursor = await db.execute(
+        """
+        UPDATE articles SET published = normalize_ts(published)
+        WHERE published IS NOT NULL AND published != normalize_ts(published)
+        """
+    )
+    await db.commit()
+    
+    print(f"標準化完成: {cursor.rowcount} 條記錄已更新")
+
+
+# 已是標準化格式（UTC 的 RFC 2822）的時間字符串
+_STANDARD_TIME_RE = re.compile(
+    r"^[A-Z][a-z]{2}, \d{2} [A-Z][a-z]{2} \d{4} \d{2}:\d{2}:\d{2} \+0000$"
+)
+
+
+def _parse_time_string(time_str: Optional[str]) -> Optional[datetime]:
+    """
+    解析RFC 2822或ISO 8601時間字符串為UTC datetime
+    
+    Returns:
+        帶UTC時區的datetime，無法解析時返回None（無時區資訊的時間視為UTC）
+    """
+    if not time_str:
+        return None
     
-    updated_count = 0
-    for link, old_published in rows:
+    try:
+        dt = parsedate_to_datetime(time_str)
+    except (TypeError, ValueError):
         try:
-            standardized_time = _standardize_time_string(old_published)
-            if standardized_time != old_published:
-                await db.execute(
-                    "UPDATE articles SET published = ? WHERE link = ?",
-                    (standardized_time, link)
-                )
-                updated_count += 1
-        except Exception as e:
-            print(f"標準化時間失敗 {link}: {e}")
+            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+        except ValueError:
+            return None
     
-    print(f"標準化完成: {updated_count} 條記錄已更新")
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=4096)
 def _standardize_time_string(time_str: str) -> str:
     """
-    標準化時間字符串為RFC 2822格式
+    標準化時間字符串為UTC的RFC 2822格式
+    
+    結果只取決於輸入字符串，同一時間字符串在遷移與寫入時會重複出現，因此加上快取
     """
     if not time_str:
         return ''
     
-    try:
-        import time as time_module
-        import re
-        from datetime import datetime
-        
-        # 如果已經是RFC 2822格式，進行標準化處理
-        if re.match(r'^[A-Za-z]{3}, \d{1,2} [A-Za-z]{3} \d{4} \d{2}:\d{2}:\d{2}', time_str):
-            # 確保時區格式統一
-            if time_str.endswith(' +0000') or time_str.endswith(' GMT') or time_str.endswith(' UTC'):
-                return re.sub(r' (GMT|UTC)$', ' +0000', time_str)
-            elif '+' in time_str or '-' in time_str[-6:]:
-                # 保持原有時區格式
-                return time_str
-            else:
-                # 如果沒有時區信息，添加 +0000
-                return time_str + ' +0000'
-        
-        # 嘗試解析RFC 2822格式並標準化
-        try:
-            parsed_time = time_module.strptime(time_str.replace(' GMT', ' +0000').replace(' UTC', ' +0000'), '%a, %d %b %Y %H:%M:%S %z')
-            dt = datetime(*parsed_time[:6])
-            return dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-        except ValueError:
-            pass
-        
-        # 嘗試解析ISO 8601格式並轉換為RFC 2822
-        try:
-            if 'T' in time_str:
-                # 處理不同的ISO 8601變體
-                time_part = time_str.split('+')[0].split('Z')[0]
-                if time_part.count('-') > 2:  # 包含時區的情況
-                    time_part = time_part.rsplit('-', 1)[0]
-                dt = datetime.fromisoformat(time_part)
-                return dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-        except ValueError:
-            pass
-        
+    # 已標準化的字符串直接返回，省去解析與格式化
+    if _STANDARD_TIME_RE.match(time_str):
+        return time_str
+    
+    dt = _parse_time_string(time_str)
+    if dt is None:
         # 如果都無法解析，返回原始字符串
         return time_str
+    return dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
+
+
+@lru_cache(maxsize=4096)
+def _published_to_epoch(published: Optional[str]) -> int:
+    """
+    將發布時間字符串轉換為UTC epoch秒數，供排序與範圍查詢使用
+    
+    Returns:
+        epoch秒數，無法解析時返回0（排序時排在最後）
+    """
+    dt = _parse_time_string(published)
+    if dt is None:
+        return 0
+    return int(dt.timestamp())
+
+
+async def _ensure_published_ts_column(db: aiosqlite.Connection) -> None:
+    """
+    為舊資料庫新增 published_ts 欄位並回填現有文章的 epoch 時間
+    """
+    async with db.execute("PRAGMA table_info(articles)") as cursor:
+        columns = [col[1] for col in await cursor.fetchall()]
+    
+    if 'published_ts' in columns:
+        return
+    
+    print("新增published_ts欄位並回填現有文章的發布時間...")
+    await db.execute(
+        "ALTER TABLE articles ADD COLUMN published_ts INTEGER NOT NULL DEFAULT 0"
+    )
+    
+    cursor = await db.execute("UPDATE articles SET published_ts = published_epoch(published)")
+    print(f"published_ts回填完成: {cursor.rowcount} 條記錄")
+
+
+async def _ensure_translation_mask_column(db: aiosqlite.Connection) -> None:
+    """
+    為舊資料庫新增 translation_mask 欄位並依現有翻譯標題回填
+    """
+    async with db.execute("PRAGMA table_info(articles)") as cursor:
+        columns = [col[1] for col in await cursor.fetchall()]
+    
+    if 'translation_mask' in columns:
+        return
+    
+    print("新增translation_mask欄位並回填現有文章的翻譯狀態...")
+    await db.execute(
+        "ALTER TABLE articles ADD COLUMN translation_mask INTEGER NOT NULL DEFAULT 0"
+    )
+    
+    mask_expr = " | ".join(
+        f"(CASE WHEN {LANGUAGE_COLUMNS[language][0]} IS NOT NULL THEN {bit} ELSE 0 END)"
+        for language, bit in TRANSLATION_BITS.items()
+    )
+    cursor = await db.execute(f"UPDATE articles SET translation_mask = {mask_expr}")
+    print(f"translation_mask回填完成: {cursor.rowcount} 條記錄")
+
+
+# 文章表的索引（名稱, 建立語句）
+_ARTICLE_INDEXES = (
+    # 以 link 作為同一時間的次要排序，讓 keyset 分頁可直接沿索引往後讀取
+    (
+        "idx_articles_published_ts_link",
+        "CREATE INDEX IF NOT EXISTS idx_articles_published_ts_link ON articles(published_ts DESC, link DESC)",
+    ),
+    ("idx_articles_feed_source", "CREATE INDEX IF NOT EXISTS idx_articles_feed_source ON articles(feed_source)"),
+    # 待翻譯佇列的部分索引：只包含尚未翻譯的文章，翻譯完成後自動移出索引
+    # （條件必須與 _UNTRANSLATED_ARTICLES_SQL 的 WHERE 完全相同，查詢才會使用這些索引）
+    *(
+        (
+            f"idx_pending_{language}",
+            f"CREATE INDEX IF NOT EXISTS idx_pending_{language} ON articles(published_ts DESC) "
+            f"WHERE (translation_mask & {bit}) = 0",
+        )
+        for language, bit in TRANSLATION_BITS.items()
+    ),
+    # 缺少任一語言翻譯的文章（條件必須與 _MISSING_TRANSLATIONS_SQL 的 WHERE 完全相同）
+    (
+        "idx_pending_any",
+        "CREATE INDEX IF NOT EXISTS idx_pending_any ON articles(published_ts DESC) "
+        f"WHERE translation_mask != {FULLY_TRANSLATED_MASK}",
+    ),
+)
+
+# 已被取代的舊索引，建立新索引前先移除
+_OBSOLETE_ARTICLE_INDEXES = (
+    "idx_articles_published",
+    "idx_articles_published_ts",
+    "idx_untranslated_zh_tw",
+    "idx_untranslated_zh_cn",
+    "idx_untranslated_en",
+)
+
+
+# 移除舊索引並建立所有文章索引的腳本（init_db 使用）
+_ARTICLE_INDEX_SCRIPT = "".join(
+    [f"DROP INDEX IF EXISTS {index_name};\n" for index_name in _OBSOLETE_ARTICLE_INDEXES]
+    + [f"{create_sql};\n" for _, create_sql in _ARTICLE_INDEXES]
+)
+
+
+async def _create_article_indexes(db: aiosqlite.Connection) -> None:
+    """
+    建立文章表的所有索引
+    """
+    for _, create_sql in _ARTICLE_INDEXES:
+        await db.execute(create_sql)
+
+
+async def _mark_migrated(db: aiosqlite.Connection) -> None:
+    """
+    記錄資料庫已達目前結構版本
+    """
+    global _MIGRATED
+    # PRAGMA 不支援參數綁定，版本號為模組常數
+    await db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    _MIGRATED = True
+
+
+# 資料表結構：文章表、翻譯日誌表及其索引，以單次 executescript 建立
+_SCHEMA_SQL = """
+    -- 精簡的文章表
+    CREATE TABLE IF NOT EXISTS articles (
+        -- 主鍵
+        link TEXT PRIMARY KEY,
         
-    except Exception:
-        return time_str
+        -- 原始內容
+        original_title TEXT NOT NULL,
+        original_summary TEXT,
+        
+        -- RSS 來源資訊 (使用DATETIME類型以提升排序性能)
+        published DATETIME,
+        feed_source TEXT,
+        
+        -- 翻譯內容
+        title_zh_tw TEXT,
+        summary_zh_tw TEXT,
+        title_zh_cn TEXT,
+        summary_zh_cn TEXT,
+        title_en TEXT,
+        summary_en TEXT,
+        
+        -- 發布時間的 UTC epoch 秒數，用於排序（RFC 2822 字串無法依字典序排序）
+        published_ts INTEGER NOT NULL DEFAULT 0,
+        
+        -- 已翻譯語言的位元遮罩（見 TRANSLATION_BITS），篩選待翻譯文章時只需檢查一個整數欄位
+        translation_mask INTEGER NOT NULL DEFAULT 0
+    );
+    
+    -- 翻譯日誌表（用於追蹤翻譯歷史）
+    CREATE TABLE IF NOT EXISTS translation_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        article_link TEXT NOT NULL,
+        target_language TEXT NOT NULL,
+        translation_type TEXT NOT NULL, -- 'title', 'summary', 'content'
+        original_text TEXT,
+        translated_text TEXT,
+        translation_service TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        success BOOLEAN DEFAULT TRUE,
+        error_message TEXT,
+        FOREIGN KEY (article_link) REFERENCES articles (link) ON DELETE CASCADE
+    );
+    
+    -- 依文章查詢最近的日誌：複合索引可直接依 created_at 順序取出，取代僅含 article_link 的舊索引
+    DROP INDEX IF EXISTS idx_translation_logs_article;
+    CREATE INDEX IF NOT EXISTS idx_translation_logs_article_created
+        ON translation_logs(article_link, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_translation_logs_language ON translation_logs(target_language);
+    CREATE INDEX IF NOT EXISTS idx_translation_logs_created_at ON translation_logs(created_at DESC);
+    
+    -- 翻譯結果快取（鍵為標題與內容的雜湊），重新啟動後仍可沿用已完成的翻譯
+    CREATE TABLE IF NOT EXISTS translation_cache (
+        key BLOB PRIMARY KEY,
+        result TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_translation_cache_created_at ON translation_cache(created_at);
+    
+    -- 排程任務鎖：多個行程共用同一個資料庫時，同一任務同時只由一個行程執行
+    CREATE TABLE IF NOT EXISTS job_locks (
+        name TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        expires_at INTEGER NOT NULL  -- UTC epoch 秒數，過期的鎖視為已釋放（持有者異常終止時）
+    );
+"""
 
 
 async def init_db() -> None:
@@ -212,101 +711,74 @@ async def init_db() -> None:
     - 使用 URL (link) 作為主鍵
     - 只保留必要的原始內容和翻譯欄位
     - 支援多語言翻譯（繁體中文、簡體中文、英文）
-    - 使用DATETIME類型的published字段以提升排序性能
+    - 使用INTEGER類型的published_ts字段（epoch秒數）排序並建立索引
     - 簡化索引結構
     """
-    async with aiosqlite.connect(DB_FILE) as db:
+    db = await get_db()
+    async with _write_lock:
         # 檢查是否需要遷移現有表結構
-        await _migrate_published_column(db)
+        migrated = await _migrate_published_column(db)
         
-        # 創建精簡的文章表
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS articles (
-                -- 主鍵
-                link TEXT PRIMARY KEY,
-                
-                -- 原始內容
-                original_title TEXT NOT NULL,
-                original_summary TEXT,
-                
-                -- RSS 來源資訊 (使用DATETIME類型以提升排序性能)
-                published DATETIME,
-                feed_source TEXT,
-                
-                -- 翻譯內容
-                title_zh_tw TEXT,
-                summary_zh_tw TEXT,
-                title_zh_cn TEXT,
-                summary_zh_cn TEXT,
-                title_en TEXT,
-                summary_en TEXT
-            )
-            """
-        )
+        # 創建資料表與翻譯日誌索引（單次 executescript，不逐條經過背景執行緒）
+        await db.executescript(_SCHEMA_SQL)
+        await _ensure_published_ts_column(db)
+        await _ensure_translation_mask_column(db)
         
-        # 創建基本索引
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published DESC)"
-        )
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_articles_feed_source ON articles(feed_source)"
-        )
-        
-        # 創建翻譯日誌表（用於追蹤翻譯歷史）
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS translation_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                article_link TEXT NOT NULL,
-                target_language TEXT NOT NULL,
-                translation_type TEXT NOT NULL, -- 'title', 'summary', 'content'
-                original_text TEXT,
-                translated_text TEXT,
-                translation_service TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                success BOOLEAN DEFAULT TRUE,
-                error_message TEXT,
-                FOREIGN KEY (article_link) REFERENCES articles (link) ON DELETE CASCADE
-            )
-            """
-        )
-        
-        # 創建翻譯日誌索引
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_translation_logs_article ON translation_logs(article_link)"
-        )
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_translation_logs_language ON translation_logs(target_language)"
-        )
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_translation_logs_created_at ON translation_logs(created_at DESC)"
-        )
+        # 創建基本索引：必須在遷移完成、資料全部寫入後才建立，
+        # 讓 b-tree 一次建好而不是在遷移過程中逐筆維護
+        if migrated:
+            # 排序索引建立在 published_ts 上（舊版建立在 published 文字欄位上的索引已無用）
+            await db.executescript(_ARTICLE_INDEX_SCRIPT)
+            await _mark_migrated(db)
+        else:
+            print("遷移未完成，暫不建立文章索引（下次啟動時重試）")
         
         await db.commit()
 
 async def delete_old_articles(days: int = 7) -> int:
     """
-    刪除 published 早於指定天數前的新聞
+    刪除 published_ts 早於指定天數前的新聞
     Args:
         days: 保留幾天內的新聞（預設7天）
     Returns:
         刪除的文章數量
     """
-    import aiosqlite
-    from datetime import datetime, timedelta
-
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    cutoff_str = cutoff.strftime('%Y-%m-%d %H:%M:%S')
-    async with aiosqlite.connect(DB_FILE) as db:
-        # SQLite DATETIME 格式比對
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff_ts = int(cutoff.timestamp())
+    db = await get_db()
+    async with _write_lock:
+        # 以 published_ts 比對（0 表示無法解析的時間，不刪除）
         cursor = await db.execute(
-            "DELETE FROM articles WHERE published IS NOT NULL AND published < ?",
-            (cutoff_str,)
+            "DELETE FROM articles WHERE published_ts > 0 AND published_ts < ?",
+            (cutoff_ts,)
         )
         await db.commit()
+        if cursor.rowcount:
+            _bump_data_version()
         return cursor.rowcount
 
+# 文章資料元組的欄位順序（insert_articles_bulk 使用）
+ARTICLE_COLUMNS = (
+    "link", "original_title", "original_summary", "published", "feed_source",
+    "title_zh_tw", "summary_zh_tw", "title_zh_cn", "summary_zh_cn",
+    "title_en", "summary_en",
+)
+
+# 只略過 URL 重複的文章；其他約束錯誤（如標題為 NULL）仍會拋出，不會被靜默吞掉
+_INSERT_ARTICLE_SQL = f"""
+    INSERT INTO articles ({", ".join(ARTICLE_COLUMNS)}, published_ts, translation_mask)
+    VALUES ({", ".join("?" * (len(ARTICLE_COLUMNS) + 2))})
+    ON CONFLICT(link) DO NOTHING
+"""
+
+# 每次 executemany 的最大筆數
+_BULK_INSERT_BATCH_SIZE = 400
+
+# 每批次新增累計達此數量後執行 ANALYZE
+_ANALYZE_INTERVAL = 1000
+_inserted_since_analyze = 0
+
+
 async def insert_article(
     link: str,
     original_title: str,
@@ -335,34 +807,140 @@ async def insert_article(
     Returns:
         True 如果文章成功插入，False 如果文章已存在
     """
-    if not link or not link.strip():
+    rows = _prepare_rows([
+        (
+            link, original_title, original_summary, published, feed_source,
+            title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn,
+            title_en, summary_en
+        )
+    ])
+    if not rows:
         return False
     
-    if not original_title or not original_title.strip():
-        return False
+    async def op(db: aiosqlite.Connection) -> bool:
+        cursor = await db.execute(_INSERT_ARTICLE_SQL, rows[0])
+        return cursor.rowcount == 1
     
-    async with aiosqlite.connect(DB_FILE) as db:
-        try:
-            await db.execute(
-                """
-                INSERT INTO articles (
-                    link, original_title, original_summary, published, feed_source,
-                    title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn,
-                    title_en, summary_en
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    link, original_title, original_summary, published, feed_source,
-                    title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn,
-                    title_en, summary_en
-                )
+    # 單筆寫入經由群組提交，與同時間的其他寫入共用一次提交
+    return await _submit_write(op, changes_articles=True)
+
+
+# ARTICLE_COLUMNS 中各語言翻譯標題的位置與其在 translation_mask 中的位元
+_TITLE_MASK_BITS = tuple(
+    (ARTICLE_COLUMNS.index(LANGUAGE_COLUMNS[language][0]), bit)
+    for language, bit in TRANSLATION_BITS.items()
+)
+
+
+def _prepare_rows(rows: List[tuple], validated: bool = False) -> List[tuple]:
+    """
+    略過沒有URL或標題的文章，並附加排序用的 published_ts 與 translation_mask
+    
+    Args:
+        rows: 文章資料元組列表
+        validated: 呼叫端是否已清理並驗證過URL與標題（是則不再逐列檢查）
+    """
+    if not validated:
+        rows = [row for row in rows if row[0] and row[0].strip() and row[1] and row[1].strip()]
+    return [
+        (
+            *row,
+            _published_to_epoch(row[3]),
+            sum(bit for index, bit in _TITLE_MASK_BITS if row[index]),
+        )
+        for row in rows
+    ]
+
+
+async def insert_articles_bulk(rows: List[tuple], validated: bool = False) -> int:
+    """
+    在單一交易中批次插入多篇文章，已存在的URL會被略過
+    
+    Args:
+        rows: 文章資料元組列表，欄位順序與 ARTICLE_COLUMNS 相同
+        validated: 呼叫端是否已確保每列的URL與標題皆已去除空白且非空
+        
+    Returns:
+        實際新增的文章數量
+    """
+    rows = _prepare_rows(rows, validated)
+    if not rows:
+        return 0
+    
+    db = await get_db()
+    async with _write_lock:
+        return await _insert_rows(db, rows)
+
+
+async def _insert_rows(db: aiosqlite.Connection, rows: List[tuple]) -> int:
+    """
+    在單一交易中寫入已整理好的文章資料（呼叫端需持有寫入鎖）
+    """
+    try:
+        # 一開始就取得寫入鎖，避免交易中途才升級鎖而遇到 SQLITE_BUSY
+        await db.execute("BEGIN IMMEDIATE")
+        changes_before = db.total_changes
+        for start in range(0, len(rows), _BULK_INSERT_BATCH_SIZE):
+            await db.executemany(
+                _INSERT_ARTICLE_SQL,
+                rows[start:start + _BULK_INSERT_BATCH_SIZE]
             )
+        # 因 URL 重複而略過的列不計入 total_changes，差值即為實際新增數量
+        inserted = db.total_changes - changes_before
+        await db.commit()
+        if inserted:
+            _bump_data_version()
+    except Exception:
+        await db.rollback()
+        raise
+    
+    await _analyze_if_needed(db, inserted)
+    return inserted
+
+
+async def _analyze_if_needed(db: aiosqlite.Connection, inserted: int) -> None:
+    """
+    累計新增文章數，每新增 _ANALYZE_INTERVAL 篇後重新收集文章表的統計資訊（呼叫端需持有寫入鎖）
+    
+    讓查詢規劃器依 sqlite_stat1 中實際的資料分布選擇索引（例如待翻譯佇列的部分索引）
+    """
+    global _inserted_since_analyze
+    _inserted_since_analyze += inserted
+    if _inserted_since_analyze < _ANALYZE_INTERVAL:
+        return
+    
+    _inserted_since_analyze = 0
+    await db.execute("ANALYZE articles")
+    await db.commit()
+
+
+async def rebuild_indexes(rows: Optional[List[tuple]] = None) -> int:
+    """
+    移除文章索引、（可選）批次匯入文章，再重新建立索引
+    
+    這是大量匯入（例如完整重新匯入歷史資料）的建議路徑：
+    先寫入所有資料再一次性建立 b-tree，比逐筆維護索引快得多。
+    
+    Args:
+        rows: 可選的文章資料元組列表，格式與 insert_articles_bulk 相同
+        
+    Returns:
+        實際新增的文章數量
+    """
+    rows = _prepare_rows(rows or [])
+    
+    db = await get_db()
+    async with _write_lock:
+        for index_name, _ in _ARTICLE_INDEXES:
+            await db.execute(f"DROP INDEX IF EXISTS {index_name}")
+        
+        try:
+            inserted = await _insert_rows(db, rows) if rows else 0
+        finally:
+            await _create_article_indexes(db)
             await db.commit()
-            return True
-        except aiosqlite.IntegrityError:
-            # 文章已存在
-            return False
+        
+        return inserted
 
 
 async def article_exists(link: str) -> bool:
@@ -378,109 +956,307 @@ async def article_exists(link: str) -> bool:
     if not link or not link.strip():
         return False
         
-    async with aiosqlite.connect(DB_FILE) as db:
-        async with db.execute("SELECT 1 FROM articles WHERE link = ? LIMIT 1", (link,)) as cursor:
-            result = await cursor.fetchone()
-            return result is not None
+    db = await _get_reader()
+    async with db.execute("SELECT EXISTS(SELECT 1 FROM articles WHERE link = ?)", (link,)) as cursor:
+        return bool((await cursor.fetchone())[0])
+
+
+# 單次 IN 查詢的參數數量上限（低於 SQLite 預設的綁定參數上限）
+_EXISTS_BATCH_SIZE = 500
+
+
+async def article_exists_many(links: List[str]) -> set:
+    """
+    批次檢查多個文章URL是否已存在於資料庫中
+    
+    Args:
+        links: 文章URL列表
+        
+    Returns:
+        已存在於資料庫中的URL集合
+    """
+    unique_links = list({link for link in links if link and link.strip()})
+    if not unique_links:
+        return set()
+    
+    db = await _get_reader()
+    existing = set()
+    for start in range(0, len(unique_links), _EXISTS_BATCH_SIZE):
+        chunk = unique_links[start:start + _EXISTS_BATCH_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        async with db.execute(
+            f"SELECT link FROM articles WHERE link IN ({placeholders})", chunk
+        ) as cursor:
+            existing.update(row[0] for row in await cursor.fetchall())
+    return existing
+
+
+async def fully_translated_links(links: List[str]) -> set:
+    """
+    批次查詢多個文章URL中已完成所有語言翻譯的文章
+    
+    Args:
+        links: 文章URL列表
+        
+    Returns:
+        已存在且所有語言皆已翻譯的URL集合
+    """
+    unique_links = list({link for link in links if link and link.strip()})
+    if not unique_links:
+        return set()
+    
+    db = await _get_reader()
+    translated = set()
+    for start in range(0, len(unique_links), _EXISTS_BATCH_SIZE):
+        chunk = unique_links[start:start + _EXISTS_BATCH_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        async with db.execute(
+            f"SELECT link FROM articles WHERE link IN ({placeholders}) "
+            f"AND translation_mask = {FULLY_TRANSLATED_MASK}",
+            chunk
+        ) as cursor:
+            translated.update(row[0] for row in await cursor.fetchall())
+    return translated
+
+
+async def get_cached_translations(keys: List[bytes]) -> Dict[bytes, str]:
+    """
+    批次查詢翻譯結果快取
+    
+    Args:
+        keys: 快取鍵列表
+        
+    Returns:
+        命中的快取鍵與其翻譯結果（JSON 字串）
+    """
+    if not keys:
+        return {}
+    
+    db = await _get_reader()
+    cached = {}
+    for start in range(0, len(keys), _EXISTS_BATCH_SIZE):
+        chunk = keys[start:start + _EXISTS_BATCH_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        async with db.execute(
+            f"SELECT key, result FROM translation_cache WHERE key IN ({placeholders})", chunk
+        ) as cursor:
+            cached.update(await cursor.fetchall())
+    return cached
+
+
+async def put_cached_translations(items: List[Tuple[bytes, str]]) -> None:
+    """
+    寫入翻譯結果快取（已存在的鍵保留原有結果）
+    
+    Args:
+        items: (快取鍵, 翻譯結果 JSON 字串) 列表
+    """
+    if not items:
+        return
+    
+    async def op(db: aiosqlite.Connection) -> None:
+        await db.executemany(
+            "INSERT OR IGNORE INTO translation_cache (key, result) VALUES (?, ?)", items
+        )
+    
+    await _submit_write(op)
+
+
+async def delete_old_translation_cache(days: int = 30) -> int:
+    """
+    刪除建立時間早於指定天數前的翻譯結果快取
+    
+    Args:
+        days: 保留幾天內的快取（預設30天）
+        
+    Returns:
+        刪除的快取數量
+    """
+    db = await get_db()
+    async with _write_lock:
+        cursor = await db.execute(
+            "DELETE FROM translation_cache WHERE created_at < datetime('now', ?)",
+            (f"-{days} days",)
+        )
+        await db.commit()
+        return cursor.rowcount
+
+
+# 只有鎖不存在或已過期時才會取得（ON CONFLICT 的 WHERE 不成立時不更新任何資料列）
+_ACQUIRE_JOB_LOCK_SQL = """
+    INSERT INTO job_locks (name, owner, expires_at) VALUES (?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+    WHERE job_locks.expires_at < ?
+"""
+
+
+async def try_acquire_job_lock(name: str, owner: str, ttl_seconds: int) -> bool:
+    """
+    嘗試取得排程任務鎖
+    
+    Args:
+        name: 任務名稱
+        owner: 持有者識別（例如主機名稱與行程ID）
+        ttl_seconds: 鎖的有效秒數，超過後其他行程可以取得
+        
+    Returns:
+        是否取得鎖
+    """
+    now = int(time.time())
+    
+    async def op(db: aiosqlite.Connection) -> bool:
+        cursor = await db.execute(_ACQUIRE_JOB_LOCK_SQL, (name, owner, now + ttl_seconds, now))
+        return cursor.rowcount == 1
+    
+    return await _submit_write(op)
+
+
+async def release_job_lock(name: str, owner: str) -> None:
+    """
+    釋放自己持有的排程任務鎖
+    
+    Args:
+        name: 任務名稱
+        owner: 取得鎖時使用的持有者識別
+    """
+    async def op(db: aiosqlite.Connection) -> None:
+        await db.execute("DELETE FROM job_locks WHERE name = ? AND owner = ?", (name, owner))
+    
+    await _submit_write(op)
+
+
+def _rows_to_dicts(cursor: aiosqlite.Cursor, rows: List[aiosqlite.Row]) -> List[Dict[str, Any]]:
+    """
+    將查詢結果轉為字典列表，欄位名稱只從 cursor.description 取一次
+    """
+    columns = tuple(description[0] for description in cursor.description)
+    return [dict(zip(columns, row)) for row in rows]
+
+
+# fetch_articles 的固定查詢：所有語言共用同一段 SQL（語言只影響綁定參數），
+# 由呼叫端自行依語言挑選欄位；翻譯篩選以 (translation_mask & bit) = bit 表示，bit 為 0 時不篩選
+_FETCH_ARTICLES_TEMPLATE = """
+    SELECT
+        link, original_title, original_summary, published, feed_source,
+        title_zh_tw, summary_zh_tw, title_zh_cn, summary_zh_cn, title_en, summary_en,
+        translation_mask, published_ts
+    FROM articles
+    WHERE (translation_mask & ?) = ?{keyset}
+    ORDER BY published_ts DESC, link DESC
+    LIMIT ?
+"""
+_FETCH_ARTICLES_SQL = _FETCH_ARTICLES_TEMPLATE.format(keyset="")
+# keyset 分頁：從上一頁最後一篇 (published_ts, link) 之後繼續，不必以 OFFSET 跳過前面的資料列
+_FETCH_ARTICLES_BEFORE_SQL = _FETCH_ARTICLES_TEMPLATE.format(
+    keyset="\n      AND (published_ts, link) < (?, ?)"
+)
+
+
+def _fetch_articles_query(
+    limit: Optional[int],
+    language: str,
+    include_untranslated: bool,
+    before: Optional[Tuple[int, str]]
+) -> Tuple[str, tuple]:
+    """
+    產生 fetch_articles / iter_articles 使用的 SQL 與綁定參數
+    """
+    # 只取已翻譯的文章時篩選該語言的位元，否則不篩選
+    bit = 0 if include_untranslated else TRANSLATION_BITS.get(language, 0)
+    limit_param = limit if limit is not None else -1
+    if before is None:
+        return _FETCH_ARTICLES_SQL, (bit, bit, limit_param)
+    return _FETCH_ARTICLES_BEFORE_SQL, (bit, bit, before[0], before[1], limit_param)
+
+# 各語言的待翻譯查詢與翻譯更新語句在載入模組時一次產生：位元以字面值寫入 SQL，
+# 查詢條件才能與部分索引的條件相符，且每種語言固定使用同一段 SQL 文字
+_UNTRANSLATED_ARTICLES_SQL = {
+    language: f"""
+        SELECT
+            link, original_title, original_summary, published, feed_source
+        FROM articles
+        WHERE (translation_mask & {bit}) = 0
+        ORDER BY published_ts DESC
+        LIMIT ?
+    """
+    for language, bit in TRANSLATION_BITS.items()
+}
+
+# 一次查出缺少任一語言翻譯的文章，由 translation_mask 判斷缺少哪些語言
+_MISSING_TRANSLATIONS_SQL = f"""
+    SELECT
+        link, original_title, original_summary, published, feed_source, translation_mask
+    FROM articles
+    WHERE translation_mask != {FULLY_TRANSLATED_MASK}
+    ORDER BY published_ts DESC
+    LIMIT ?
+"""
+
+_UPDATE_TRANSLATION_SQL = {
+    language: (
+        f"UPDATE articles SET {title_column} = ?, {summary_column} = ?, "
+        f"translation_mask = translation_mask | {TRANSLATION_BITS[language]} WHERE link = ?"
+    )
+    for language, (title_column, summary_column) in LANGUAGE_COLUMNS.items()
+}
 
 
 async def fetch_articles(
     limit: Optional[int] = None,
     language: str = "zh_tw",
-    include_untranslated: bool = True
-) -> List[Dict[str, Any]]:
+    include_untranslated: bool = True,
+    before: Optional[Tuple[int, str]] = None
+) -> List[aiosqlite.Row]:
     """
-    從資料庫獲取文章，按發布日期排序
+    從資料庫獲取文章，按發布日期排序（排序與 limit 皆在 SQL 中完成）
+    
+    回傳原始內容與所有語言的翻譯欄位，顯示哪個語言的標題與摘要由呼叫端決定
     
     Args:
         limit: 可選的最大文章數量限制
-        language: 目標語言 ('zh_tw', 'zh_cn', 'en', 'original')
+        language: 目標語言 ('zh_tw', 'zh_cn', 'en', 'original')，僅用於篩選已翻譯的文章
         include_untranslated: 是否包含未翻譯的文章
+        before: 可選的分頁游標 (published_ts, link)，只回傳排在此文章之後的文章
         
     Returns:
-        文章列表（字典格式）
-    """
-    # 根據語言選擇相應的欄位
-    if language == "zh_tw":
-        title_field = "COALESCE(title_zh_tw, original_title)"
-        summary_field = "COALESCE(summary_zh_tw, original_summary)"
-    elif language == "zh_cn":
-        title_field = "COALESCE(title_zh_cn, original_title)"
-        summary_field = "COALESCE(summary_zh_cn, original_summary)"
-    elif language == "en":
-        title_field = "COALESCE(title_en, original_title)"
-        summary_field = "COALESCE(summary_en, original_summary)"
-    else:  # original
-        title_field = "original_title"
-        summary_field = "original_summary"
-    
-    where_clause = ""
-    if not include_untranslated and language != "original":
-        if language == "zh_tw":
-            where_clause = "WHERE title_zh_tw IS NOT NULL"
-        elif language == "zh_cn":
-            where_clause = "WHERE title_zh_cn IS NOT NULL"
-        elif language == "en":
-            where_clause = "WHERE title_en IS NOT NULL"
+        文章列表（aiosqlite.Row，可用欄位名稱存取，由呼叫端在輸出時再轉換）
+    """
+    query, params = _fetch_articles_query(limit, language, include_untranslated, before)
+
+    db = await _get_reader()
+    async with db.execute(query, params) as cursor:
+        return await cursor.fetchall()
+
+
+async def iter_articles(
+    limit: Optional[int] = None,
+    language: str = "zh_tw",
+    include_untranslated: bool = True,
+    batch_size: int = 250,
+    before: Optional[Tuple[int, str]] = None
+) -> AsyncIterator[List[aiosqlite.Row]]:
+    """
+    與 fetch_articles 相同的查詢，但以 fetchmany 分批取出，供串流回應逐批輸出
     
-    query = f"""
-        SELECT
-            link,
-            {title_field} as title,
-            {summary_field} as summary,
-            original_title,
-            original_summary,
-            published,
-            feed_source,
-            title_zh_tw,
-            summary_zh_tw,
-            title_zh_cn,
-            summary_zh_cn,
-            title_en,
-            summary_en
-        FROM articles
-        {where_clause}
+    Args:
+        limit: 可選的最大文章數量限制
+        language: 目標語言 ('zh_tw', 'zh_cn', 'en', 'original')，僅用於篩選已翻譯的文章
+        include_untranslated: 是否包含未翻譯的文章
+        batch_size: 每批取出的文章數量
+        before: 可選的分頁游標 (published_ts, link)
+        
+    Yields:
+        每批文章（aiosqlite.Row 列表）
     """
+    query, params = _fetch_articles_query(limit, language, include_untranslated, before)
 
-    async with aiosqlite.connect(DB_FILE) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(query) as cursor:
-            rows = await cursor.fetchall()
-            articles = [dict(row) for row in rows]
-            
-            # 在 Python 中進行排序，確保正確處理時間格式
-            def parse_published_time(published_str):
-                if not published_str:
-                    return 0
-                try:
-                    from datetime import datetime
-                    import time
-                    
-                    # 嘗試解析 RFC 2822 格式
-                    if ',' in published_str:
-                        parsed_time = time.strptime(published_str.replace(' GMT', ' +0000').replace(' UTC', ' +0000'), '%a, %d %b %Y %H:%M:%S %z')
-                        return time.mktime(parsed_time)
-                    
-                    # 嘗試解析 ISO 格式
-                    if 'T' in published_str:
-                        dt = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
-                        return dt.timestamp()
-                    
-                    # 嘗試直接解析
-                    dt = datetime.fromisoformat(published_str)
-                    return dt.timestamp()
-                    
-                except:
-                    return 0
-            
-            # 按發布時間降序排序（最新的在前）
-            articles.sort(key=lambda x: parse_published_time(x.get('published', '')), reverse=True)
-            
-            # 應用 limit
-            if limit is not None:
-                articles = articles[:limit]
-                
-            return articles
+    db = await _get_reader()
+    async with db.execute(query, params) as cursor:
+        while True:
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
 
 
 async def fetch_articles_for_translation(
@@ -497,34 +1273,71 @@ async def fetch_articles_for_translation(
     Returns:
         需要翻譯的文章列表
     """
-    # 根據目標語言構建查詢條件
-    if target_language == "zh_tw":
-        condition = "title_zh_tw IS NULL"
-    elif target_language == "zh_cn":
-        condition = "title_zh_cn IS NULL"
-    elif target_language == "en":
-        condition = "title_en IS NULL"
-    else:
+    query = _UNTRANSLATED_ARTICLES_SQL.get(target_language)
+    if query is None:
         raise ValueError(f"不支援的目標語言: {target_language}")
+    params = (limit if limit is not None else -1,)
+
+    db = await _get_reader()
+    async with db.execute(query, params) as cursor:
+        return _rows_to_dicts(cursor, await cursor.fetchall())
+
+
+async def fetch_missing_translations(
+    limit: Optional[int] = None
+) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """
+    以單一查詢獲取缺少任一語言翻譯的文章
     
-    query = f"""
-        SELECT
-            link, original_title, original_summary, published, feed_source
-        FROM articles
-        WHERE {condition}
-        ORDER BY published DESC
+    Args:
+        limit: 限制返回的文章數量
+        
+    Returns:
+        (文章, 缺少的語言列表) 的列表，依發布時間由新到舊排序
     """
+    params = (limit if limit is not None else -1,)
     
-    params: tuple[Any, ...] = ()
-    if limit is not None:
-        query += " LIMIT ?"
-        params = (limit,)
+    db = await _get_reader()
+    async with db.execute(_MISSING_TRANSLATIONS_SQL, params) as cursor:
+        articles = _rows_to_dicts(cursor, await cursor.fetchall())
+    
+    result = []
+    for article in articles:
+        mask = article.pop("translation_mask")
+        result.append((
+            article,
+            [language for language, bit in TRANSLATION_BITS.items() if not mask & bit]
+        ))
+    return result
+
+
+_INSERT_TRANSLATION_LOG_SQL = """
+    INSERT INTO translation_logs (
+        article_link, target_language, translation_type,
+        translated_text, translation_service, success, error_message
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
-    async with aiosqlite.connect(DB_FILE) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+
+def _translation_log_rows(
+    article_link: str,
+    target_language: str,
+    title: Optional[str],
+    summary: Optional[str],
+    translation_service: str,
+    success: bool,
+    error_message: Optional[str]
+) -> List[tuple]:
+    """
+    產生標題與摘要的翻譯日誌資料列（內容為空者略過）
+    """
+    return [
+        (article_link, target_language, translation_type, text,
+         translation_service, success, error_message)
+        for translation_type, text in (("title", title), ("summary", summary))
+        if text
+    ]
 
 
 async def update_article_translation(
@@ -554,62 +1367,78 @@ async def update_article_translation(
     if not article_link or not article_link.strip():
         return False
     
-    if target_language not in ["zh_tw", "zh_cn", "en"]:
+    if target_language not in LANGUAGE_COLUMNS:
         return False
     
-    async with aiosqlite.connect(DB_FILE) as db:
+    async def op(db: aiosqlite.Connection) -> bool:
         # 更新文章翻譯
+        updated = False
         if success and title:
-            # 根據目標語言更新相應欄位
-            if target_language == "zh_tw":
-                update_fields = "title_zh_tw = ?, summary_zh_tw = ?"
-                params = (title, summary, article_link)
-            elif target_language == "zh_cn":
-                update_fields = "title_zh_cn = ?, summary_zh_cn = ?"
-                params = (title, summary, article_link)
-            else:  # en
-                update_fields = "title_en = ?, summary_en = ?"
-                params = (title, summary, article_link)
-            
-            await db.execute(
-                f"""
-                UPDATE articles SET {update_fields}
-                WHERE link = ?
-                """,
-                params
+            # 根據目標語言更新相應欄位，直接以 cursor.rowcount 判斷是否有行被更新
+            cursor = await db.execute(
+                _UPDATE_TRANSLATION_SQL[target_language],
+                (title, summary, article_link)
             )
+            updated = cursor.rowcount > 0
         
-        # 記錄翻譯日誌
-        if title:
-            await db.execute(
-                """
-                INSERT INTO translation_logs (
-                    article_link, target_language, translation_type,
-                    translated_text, translation_service, success, error_message
-                )
-                VALUES (?, ?, 'title', ?, ?, ?, ?)
-                """,
-                (article_link, target_language, title, translation_service, success, error_message)
-            )
+        # 記錄翻譯日誌（標題與摘要一次寫入）
+        log_rows = _translation_log_rows(
+            article_link, target_language, title, summary,
+            translation_service, success, error_message
+        )
+        if log_rows:
+            await db.executemany(_INSERT_TRANSLATION_LOG_SQL, log_rows)
         
-        if summary:
-            await db.execute(
-                """
-                INSERT INTO translation_logs (
-                    article_link, target_language, translation_type,
-                    translated_text, translation_service, success, error_message
-                )
-                VALUES (?, ?, 'summary', ?, ?, ?, ?)
-                """,
-                (article_link, target_language, summary, translation_service, success, error_message)
-            )
+        return updated
+    
+    # 經由群組提交，與同時完成的其他翻譯共用一次提交
+    return await _submit_write(op, changes_articles=True)
+
+
+async def update_article_translations_bulk(items: List[Dict[str, Any]]) -> int:
+    """
+    在單一交易中批次更新多篇文章的翻譯內容並記錄翻譯日誌
+    
+    Args:
+        items: 翻譯結果列表，每項的鍵與 update_article_translation 的參數相同
+               (article_link, target_language, title, summary,
+               translation_service, success, error_message)
         
-        await db.commit()
+    Returns:
+        實際更新的文章數量
+    """
+    updates: Dict[str, List[tuple]] = {}
+    log_rows = []
+    for item in items:
+        article_link = item.get("article_link")
+        target_language = item.get("target_language")
+        if not article_link or not article_link.strip() or target_language not in LANGUAGE_COLUMNS:
+            continue
         
-        # 檢查是否有行被更新
-        async with db.execute("SELECT changes()") as cur:
-            row = await cur.fetchone()
-            return bool(row[0])
+        title = item.get("title")
+        summary = item.get("summary")
+        success = item.get("success", True)
+        if success and title:
+            updates.setdefault(target_language, []).append((title, summary, article_link))
+        log_rows.extend(_translation_log_rows(
+            article_link, target_language, title, summary,
+            item.get("translation_service", "unknown"), success, item.get("error_message")
+        ))
+    
+    if not updates and not log_rows:
+        return 0
+    
+    async def op(db: aiosqlite.Connection) -> int:
+        updated = 0
+        # 同一語言的更新共用同一條語句，一次 executemany 寫入
+        for target_language, params in updates.items():
+            cursor = await db.executemany(_UPDATE_TRANSLATION_SQL[target_language], params)
+            updated += cursor.rowcount
+        if log_rows:
+            await db.executemany(_INSERT_TRANSLATION_LOG_SQL, log_rows)
+        return updated
+    
+    return await _submit_write(op, changes_articles=True)
 
 
 async def get_translation_stats() -> Dict[str, Any]:
@@ -619,35 +1448,37 @@ async def get_translation_stats() -> Dict[str, Any]:
     Returns:
         翻譯統計字典
     """
-    async with aiosqlite.connect(DB_FILE) as db:
-        stats = {}
-        
-        # 總文章數
-        async with db.execute("SELECT COUNT(*) FROM articles") as cur:
-            stats["total_articles"] = (await cur.fetchone())[0]
-        
-        # 按語言統計翻譯完成情況
-        for lang in ["zh_tw", "zh_cn", "en"]:
-            async with db.execute(f"""
-                SELECT COUNT(*) FROM articles WHERE title_{lang} IS NOT NULL
-            """) as cur:
-                stats[f"translated_{lang}"] = (await cur.fetchone())[0]
-        
-        # 未翻譯文章統計
-        async with db.execute("""
-            SELECT COUNT(*) FROM articles
-            WHERE title_zh_tw IS NULL AND title_zh_cn IS NULL AND title_en IS NULL
-        """) as cur:
-            stats["untranslated"] = (await cur.fetchone())[0]
-        
-        return stats
+    db = await _get_reader()
+    
+    # 單次掃描同時取得總數、各語言翻譯完成數與未翻譯數
+    async with db.execute("""
+        SELECT
+            COUNT(*),
+            SUM(translation_mask & 1),
+            SUM((translation_mask >> 1) & 1),
+            SUM((translation_mask >> 2) & 1),
+            SUM(translation_mask = 0)
+        FROM articles
+    """) as cur:
+        row = await cur.fetchone()
+    
+    # 空資料表時 SUM 會回傳 NULL
+    total, zh_tw, zh_cn, en, untranslated = (value or 0 for value in row)
+    return {
+        "total_articles": total,
+        "translated_zh_tw": zh_tw,
+        "translated_zh_cn": zh_cn,
+        "translated_en": en,
+        "untranslated": untranslated,
+    }
 
 
 async def get_translation_logs(
     article_link: Optional[str] = None,
     target_language: Optional[str] = None,
     limit: int = 100,
-    since: Optional[str] = None
+    since: Optional[str] = None,
+    since_minutes: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     獲取翻譯日誌
@@ -657,6 +1488,7 @@ async def get_translation_logs(
         target_language: 可選的目標語言過濾
         limit: 返回記錄數限制
         since: 可選的時間過濾（ISO格式字串）
+        since_minutes: 可選，只取最近幾分鐘內的日誌（時間窗口在 SQL 端計算）
         
     Returns:
         翻譯日誌列表
@@ -676,6 +1508,11 @@ async def get_translation_logs(
         conditions.append("created_at > ?")
         params.append(since)
     
+    if since_minutes is not None:
+        # created_at 為 CURRENT_TIMESTAMP（UTC），與 datetime('now') 格式相同可直接比較
+        conditions.append("created_at > datetime('now', ?)")
+        params.append(f"-{since_minutes} minutes")
+    
     where_clause = ""
     if conditions:
         where_clause = "WHERE " + " AND ".join(conditions)
@@ -692,11 +1529,9 @@ async def get_translation_logs(
     """
     params.append(limit)
     
-    async with aiosqlite.connect(DB_FILE) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+    db = await _get_reader()
+    async with db.execute(query, params) as cursor:
+        return _rows_to_dicts(cursor, await cursor.fetchall())
 
 
 # 向後相容性函數
@@ -721,15 +1556,15 @@ async def ensure_url_uniqueness() -> Dict[str, int]:
     Returns:
         統計資訊
     """
-    async with aiosqlite.connect(DB_FILE) as db:
-        async with db.execute("SELECT COUNT(*) FROM articles") as cur:
-            total_articles = (await cur.fetchone())[0]
-        
-        async with db.execute("SELECT COUNT(*) FROM articles WHERE link IS NULL OR link = ''") as cur:
-            empty_urls = (await cur.fetchone())[0]
-        
-        return {
-            "removed_duplicates": 0,
-            "remaining_articles": total_articles,
-            "empty_urls": empty_urls
-        }
\ No newline at end of file
+    db = await _get_reader()
+    # 與翻譯統計相同，以單一查詢同時取得兩個計數
+    async with db.execute(
+        "SELECT COUNT(*), SUM(link IS NULL OR link = '') FROM articles"
+    ) as cur:
+        total_articles, empty_urls = await cur.fetchone()
+    
+    return {
+        "removed_duplicates": 0,
+        "remaining_articles": total_articles,
+        "empty_urls": empty_urls or 0
+    }
\ No newline at end of file
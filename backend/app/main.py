@@ -1,154 +1,354 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
 import os
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Literal, Mapping, Optional, Tuple
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-
-from .db import fetch_articles, init_db, get_translation_stats, ensure_url_uniqueness
-from .rss_fetcher import fetch_and_store_news, translate_missing_articles, refresh_feeds_fast
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from .db import (
+    LANGUAGE_COLUMNS,
+    TRANSLATION_BITS,
+    close_db,
+    ensure_url_uniqueness,
+    fetch_articles,
+    get_data_version,
+    get_translation_stats,
+    init_db,
+    iter_articles,
+)
+from .rss_fetcher import (
+    close_http_client,
+    fetch_and_store_news,
+    refresh_feeds_fast,
+    translate_missing_articles,
+)
 from .scheduler import get_scheduler, start_scheduler, stop_scheduler
+from .translation_service import close_translation_service, get_translation_service
 
 # 載入環境變數
 load_dotenv()
 
+class ORJSONResponse(JSONResponse):
+    """
+    使用 orjson 序列化的 JSON 回應（文章內容多為中文字串，orjson 的編碼遠快於標準庫 json）
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Initialize the database and start the scheduler on startup; stop the scheduler
+    and close the RSS HTTP client, OpenAI client and database connections on shutdown.
+    """
+    # 排程器的第一次任務在啟動 10 分鐘後才執行，不依賴資料庫初始化，可與其並行
+    await asyncio.gather(init_db(), start_scheduler())
+    yield
+    await stop_scheduler()
+    # 執行中的批次翻譯在關閉翻譯服務與資料庫前取消
+    if _batch_translate_running():
+        _batch_translate_task.cancel()
+        await asyncio.gather(_batch_translate_task, return_exceptions=True)
+    await close_http_client()
+    await close_translation_service()
+    await close_db()
+
+
 app = FastAPI(
     title="AI News Aggregator",
     description="Aggregates AI-related news from several RSS feeds.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# 允許跨來源存取的網域：可用 CORS_ORIGINS 環境變數（以逗號分隔）覆寫，預設為本機開發伺服器。
+# 正式環境的前端經由同一網域的反向代理呼叫 /api，不需要跨來源設定
+_DEFAULT_CORS_ORIGINS = (
+    "http://localhost:5173",  # Vite dev server
+    "http://127.0.0.1:5173",
+    "http://localhost:3000",  # Alternative dev server port
+    "http://127.0.0.1:3000",
+)
+CORS_ORIGINS = tuple(
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()
+) or _DEFAULT_CORS_ORIGINS
+
 # Enable CORS for development and production
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Vite dev server
-        "http://127.0.0.1:5173",
-        "http://localhost:3000",  # Alternative dev server port
-        "http://127.0.0.1:3000",
-        "*",  # Allow all origins for testing (change this in production)
-    ],
-    allow_credentials=True,
+    allow_origins=list(CORS_ORIGINS),
+    # 瀏覽器不接受萬用來源搭配憑證，只有明確列出來源時才允許憑證
+    allow_credentials="*" not in CORS_ORIGINS,
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    """
-    Initialize the database and start scheduler when the application starts.
-    """
-    await init_db()
-    await start_scheduler()
+# /api/articles 支援的語言偏好
+_ArticleLanguage = Literal["zh_tw", "zh_cn", "en", "original"]
 
+# /api/articles 的回應快取：(limit, language, cursor) -> (資料版本號, ETag, 序列化後的 JSON)
+_ARTICLES_CACHE_SIZE = 16
+_ArticlesCacheKey = Tuple[Optional[int], str, Optional[str]]
 
-@app.on_event("shutdown")
-async def on_shutdown() -> None:
-    """
-    Stop scheduler when the application shuts down.
-    """
-    await stop_scheduler()
+# 超過此文章數量（或未限制數量）時以串流方式回應
+_STREAM_THRESHOLD = 500
+_articles_cache: OrderedDict[_ArticlesCacheKey, Tuple[int, str, bytes]] = OrderedDict()
 
 
 @app.get("/api/articles")
 async def get_articles(
     limit: Optional[int] = Query(None, gt=0),
-    language: str = Query("zh_tw", description="Language for articles (zh_tw, zh_cn, en, original)")
-) -> Dict[str, Any]:
+    language: _ArticleLanguage = Query("zh_tw", description="Language for articles (zh_tw, zh_cn, en, original)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
     """
     Retrieve articles from the database with all language versions for frontend language switching.
+    
+    Serialized responses are cached per (limit, language, cursor) until the article data changes,
+    and carry an ETag so unchanged responses can be answered with 304 Not Modified.
 
     Query Args:
         limit: Optional maximum number of articles to return (must be > 0).
         language: Language preference for fallback content (zh_tw, zh_cn, en, original).
+        cursor: Optional keyset cursor; returns the articles after the previous page.
 
     Returns:
-        JSON payload containing a list of articles with all language versions.
+        JSON payload containing a list of articles with all language versions,
+        plus ``next_cursor`` when another page may follow.
     """
     try:
-        # 驗證語言參數
-        valid_languages = ["zh_tw", "zh_cn", "en", "original"]
-        if language not in valid_languages:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid language. Must be one of: {', '.join(valid_languages)}"
+        # 語言參數已由 FastAPI 依 _ArticleLanguage 驗證（不在清單內時回傳 422）
+        before = _decode_cursor(cursor) if cursor else None
+        
+        # 文章資料未變更時直接回傳快取的序列化結果
+        key = (limit, language, cursor)
+        version = get_data_version()
+        cached = _articles_cache.get(key)
+        if cached is not None and cached[0] == version:
+            _articles_cache.move_to_end(key)
+            return _articles_response(cached[1], cached[2], if_none_match)
+        
+        # 未限制數量或數量較大時改以串流回應，不必先在記憶體中組好整份結果
+        if limit is None or limit > _STREAM_THRESHOLD:
+            return StreamingResponse(
+                _stream_articles(key, version, limit, language, before),
+                media_type="application/json"
             )
         
         # 獲取原始文章數據（包含所有語言版本）
-        articles = await fetch_articles(limit=limit, language="original", include_untranslated=True)
+        articles = await fetch_articles(
+            limit=limit, language="original", include_untranslated=True, before=before
+        )
         
         # 構建包含所有語言版本的文章數據
-        cleaned_articles = []
-        for article in articles:
-            # 根據語言偏好選擇主要顯示的標題和內容
-            if language == "zh_tw":
-                primary_title = article.get("title_zh_tw") or article["original_title"]
-                primary_content = article.get("summary_zh_tw") or article["original_summary"]
-            elif language == "zh_cn":
-                primary_title = article.get("title_zh_cn") or article["original_title"]
-                primary_content = article.get("summary_zh_cn") or article["original_summary"]
-            elif language == "en":
-                primary_title = article.get("title_en") or article["original_title"]
-                primary_content = article.get("summary_en") or article["original_summary"]
-            else:  # original
-                primary_title = article["original_title"]
-                primary_content = article["original_summary"]
-            
-            cleaned_article = {
-                "link": article["link"],
-                "title": primary_title,
-                "summary": primary_content,
-                "published": article["published"],
-                "feed_source": article["feed_source"],
-                # 包含所有語言版本供前端語言切換使用
-                "title_zh_tw": article.get("title_zh_tw"),
-                "title_zh_cn": article.get("title_zh_cn"),
-                "title_en": article.get("title_en"),
-                "content_zh_tw": article.get("summary_zh_tw"),
-                "content_zh_cn": article.get("summary_zh_cn"),
-                "content_en": article.get("summary_en"),
-                # 檢測原始語言（基於哪個翻譯字段為空來推斷）
-                "original_language": _detect_original_language(article)
-            }
-            
-            cleaned_articles.append(cleaned_article)
+        fields = _LANG_FIELDS[language]
+        cleaned_articles = [_build_article(article, fields) for article in articles]
         
-        return {
+        payload = orjson.dumps({
             "articles": cleaned_articles,
             "language": language,
-            "total": len(cleaned_articles)
-        }
+            "total": len(cleaned_articles),
+            "next_cursor": _next_cursor(articles, limit)
+        })
+        etag = _cache_articles_payload(key, version, payload)
+        
+        return _articles_response(etag, payload, if_none_match)
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
-def _detect_original_language(article: Dict[str, Any]) -> str:
+def _encode_cursor(article: Mapping[str, Any]) -> str:
+    """
+    將文章的排序鍵 (published_ts, link) 編碼為網址安全的分頁游標
+    """
+    raw = f"{article['published_ts']}:{article['link']}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str]:
+    """
+    解析分頁游標
+    
+    Raises:
+        HTTPException: 游標格式不正確時回傳 400
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        published_ts, _, link = raw.partition(":")
+        return int(published_ts), link
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _next_cursor(articles: List[Mapping[str, Any]], limit: Optional[int]) -> Optional[str]:
+    """
+    頁面已滿時回傳下一頁的游標；未限制數量或已是最後一頁時回傳 None
+    """
+    if limit is None or len(articles) < limit:
+        return None
+    return _encode_cursor(articles[-1])
+
+
+def _cache_articles_payload(key: _ArticlesCacheKey, version: int, payload: bytes) -> str:
+    """
+    儲存序列化後的 /api/articles 回應
+    
+    以查詢前取得的版本號儲存，查詢期間若有寫入，下次請求會重新產生
+    
+    Returns:
+        依回應內容計算的 ETag（內容不變則 ETag 不變，服務重啟後仍然有效）
+    """
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    _articles_cache[key] = (version, etag, payload)
+    _articles_cache.move_to_end(key)
+    while len(_articles_cache) > _ARTICLES_CACHE_SIZE:
+        _articles_cache.popitem(last=False)
+    return etag
+
+
+def _articles_response(etag: str, payload: bytes, if_none_match: Optional[str]) -> Response:
+    """
+    回傳文章列表；用戶端持有的版本與目前相同時回傳 304 Not Modified
+    """
+    # 要求瀏覽器每次以 ETag 重新驗證，而不是直接沿用本機快取
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def _stream_articles(
+    key: _ArticlesCacheKey,
+    version: int,
+    limit: Optional[int],
+    language: str,
+    before: Optional[Tuple[int, str]]
+) -> AsyncIterator[bytes]:
     """
-    根據翻譯字段的存在情況推斷原始語言
+    逐批讀取文章並輸出 JSON 片段，輸出格式與非串流回應相同
     
     Args:
-        article: 文章數據字典
+        key: 回應快取的鍵
+        version: 查詢前取得的資料版本號
+        limit: 最大文章數量限制
+        language: 語言偏好
+        before: 可選的分頁游標 (published_ts, link)
+        
+    Yields:
+        JSON 片段（完整輸出後同時存入回應快取）
+    """
+    chunks = [b'{"articles":[']
+    yield chunks[0]
+    
+    fields = _LANG_FIELDS[language]
+    total = 0
+    last_row = None
+    async for rows in iter_articles(
+        limit=limit, language="original", include_untranslated=True, before=before
+    ):
+        chunk = b",".join(orjson.dumps(_build_article(row, fields)) for row in rows)
+        if total:
+            chunk = b"," + chunk
+        total += len(rows)
+        last_row = rows[-1]
+        chunks.append(chunk)
+        yield chunk
+    
+    next_cursor = _encode_cursor(last_row) if limit is not None and total >= limit else None
+    tail = (
+        b'],"language":' + orjson.dumps(language)
+        + b',"total":' + str(total).encode()
+        + b',"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+    )
+    chunks.append(tail)
+    yield tail
+    
+    _cache_articles_payload(key, version, b"".join(chunks))
+
+
+# 各語言偏好主要顯示的標題與內容欄位，於迴圈外查表一次
+_LANG_FIELDS: Dict[str, Tuple[str, str]] = {
+    **LANGUAGE_COLUMNS,
+    "original": ("original_title", "original_summary"),
+}
+
+
+def _build_article(article: Mapping[str, Any], fields: Tuple[str, str]) -> Dict[str, Any]:
+    """
+    將資料庫中的文章轉換為 API 回應格式
+    
+    Args:
+        article: 文章數據（資料列或字典）
+        fields: 主要顯示的標題與內容欄位（見 _LANG_FIELDS）
+        
+    Returns:
+        包含主要顯示內容與所有語言版本的文章字典
+    """
+    title_key, summary_key = fields
+    return {
+        "link": article["link"],
+        # 尚未翻譯時退回原文
+        "title": article[title_key] or article["original_title"],
+        "summary": article[summary_key] or article["original_summary"],
+        "published": article["published"],
+        "feed_source": article["feed_source"],
+        # 包含所有語言版本供前端語言切換使用
+        "title_zh_tw": article["title_zh_tw"],
+        "title_zh_cn": article["title_zh_cn"],
+        "title_en": article["title_en"],
+        "content_zh_tw": article["summary_zh_tw"],
+        "content_zh_cn": article["summary_zh_cn"],
+        "content_en": article["summary_en"],
+        # 檢測原始語言（基於哪個語言尚未翻譯來推斷，依遮罩預先算好）
+        "original_language": _ORIGINAL_LANGUAGE_BY_MASK[article["translation_mask"]]
+    }
+
+
+def _detect_original_language(translation_mask: int) -> str:
+    """
+    根據翻譯位元遮罩推斷原始語言
+    
+    Args:
+        translation_mask: 文章的 translation_mask（見 db.TRANSLATION_BITS）
         
     Returns:
         推斷的原始語言代碼
     """
     # 如果某個語言的翻譯為空，可能就是原始語言
-    if not article.get("title_zh_tw"):
+    if not translation_mask & TRANSLATION_BITS["zh_tw"]:
         return "zh-tw"
-    elif not article.get("title_zh_cn"):
+    elif not translation_mask & TRANSLATION_BITS["zh_cn"]:
         return "zh-cn"
-    elif not article.get("title_en"):
+    elif not translation_mask & TRANSLATION_BITS["en"]:
         return "en"
     else:
         # 如果都有翻譯，默認返回未知
         return "unknown"
 
 
+# 所有可能的遮罩值對應的原始語言，回應時直接以遮罩查表
+_ORIGINAL_LANGUAGE_BY_MASK = tuple(
+    _detect_original_language(mask) for mask in range(sum(TRANSLATION_BITS.values()) + 1)
+)
+
+
 @app.post("/api/refresh")
 async def refresh() -> Dict[str, Any]:
     """
@@ -179,23 +379,63 @@ async def refresh_fast() -> Dict[str, Any]:
     return {"detail": "Fast refresh complete", **result}
 
 
-@app.post("/api/batch-translate")
-async def batch_translate(limit: Optional[int] = Query(None, gt=0)) -> Dict[str, Any]:
+# 背景批次翻譯的執行狀態：同一時間只執行一個批次，完成後保留最近一次的結果
+_batch_translate_state: Dict[str, Any] = {"last_result": None}
+# 執行中的批次翻譯任務（保留參照，避免任務在完成前被回收）；是否執行中由任務狀態判斷
+_batch_translate_task: Optional[asyncio.Task] = None
+
+
+def _batch_translate_running() -> bool:
+    return _batch_translate_task is not None and not _batch_translate_task.done()
+
+
+async def _run_batch_translate(limit: Optional[int]) -> None:
+    """
+    在背景執行批次翻譯並記錄結果
+    """
+    result: Dict[str, Any] = {"error": "Batch translation did not finish", "processed": 0}
+    try:
+        result = await translate_missing_articles(limit)
+    except Exception as exc:
+        result = {"error": str(exc), "processed": 0}
+    finally:
+        _batch_translate_state["last_result"] = result
+
+
+@app.post("/api/batch-translate", status_code=202)
+async def batch_translate(
+    limit: Optional[int] = Query(None, gt=0)
+) -> Dict[str, Any]:
     """
     翻譯現有的未翻譯文章（向後相容性端點）
     注意：在新的即時翻譯流程中，此端點主要用於處理舊資料
     
+    翻譯以獨立的背景任務執行，不佔用請求連線，也不受用戶端提前斷線影響；進度可查詢
+    /api/batch-translate/status 或 /api/translation-stats
+    
     Query Args:
         limit: 限制處理的文章數量
         
     Returns:
-        翻譯處理結果
+        排入背景執行的狀態（已有批次執行中時不重複排入）
     """
-    try:
-        result = await translate_missing_articles(limit)
-        return {"detail": "Missing articles translation complete", **result}
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    global _batch_translate_task
+    if _batch_translate_running():
+        return {"detail": "Missing articles translation already running", "status": "running"}
+    
+    _batch_translate_task = asyncio.create_task(_run_batch_translate(limit))
+    return {"detail": "Missing articles translation queued", "status": "queued"}
+
+
+@app.get("/api/batch-translate/status")
+async def batch_translate_status() -> Dict[str, Any]:
+    """
+    獲取背景批次翻譯的執行狀態
+    
+    Returns:
+        是否執行中以及最近一次完成的翻譯結果
+    """
+    return {"running": _batch_translate_running(), **_batch_translate_state}
 
 
 @app.get("/api/translation-stats")
@@ -228,6 +468,11 @@ async def cleanup_duplicates() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+# 健康檢查的統計快取：(取得時間, 統計數據)，探針頻繁呼叫時最多每 30 秒查詢一次資料庫
+_HEALTH_STATS_TTL = 30.0
+_health_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
 @app.get("/api/health")
 async def health_check() -> Dict[str, str]:
     """
@@ -236,12 +481,17 @@ async def health_check() -> Dict[str, str]:
     Returns:
         系統狀態信息
     """
+    global _health_stats_cache
     try:
-        # 檢查數據庫連接
-        stats = await get_translation_stats()
+        # 檢查數據庫連接（最近一次成功查詢仍在有效期內則沿用）
+        now = time.monotonic()
+        if _health_stats_cache is not None and now - _health_stats_cache[0] < _HEALTH_STATS_TTL:
+            stats = _health_stats_cache[1]
+        else:
+            stats = await get_translation_stats()
+            _health_stats_cache = (now, stats)
         
         # 檢查翻譯服務
-        from .translation_service import get_translation_service
         service = get_translation_service()
         
         # 檢查調度器狀態
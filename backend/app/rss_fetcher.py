@@ -4,14 +4,21 @@ import asyncio
 import logging
 import os
 import re
-import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import feedparser
+import httpx
 from dotenv import load_dotenv
 
-from .db import insert_article, article_exists
+from .db import (
+    LANGUAGE_COLUMNS,
+    insert_articles_bulk,
+    article_exists_many,
+    fetch_missing_translations,
+    update_article_translations_bulk,
+)
 from .translation_service import get_translation_service
 
 # RSS feed sources are defined in a separate module for easier maintenance.
@@ -22,27 +29,54 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# 全局鎖，防止重複翻譯同一篇文章
-_translation_locks: Dict[str, asyncio.Lock] = {}
-_translation_locks_lock = asyncio.Lock()
+# 預先編譯的正則表達式（每個RSS條目都會用到）
+_P_TAG_RE = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
 
-async def _get_translation_lock(article_url: str) -> asyncio.Lock:
-    """獲取特定文章的翻譯鎖"""
-    async with _translation_locks_lock:
-        if article_url not in _translation_locks:
-            _translation_locks[article_url] = asyncio.Lock()
-        return _translation_locks[article_url]
+# 正在處理中（翻譯或等待寫入）的文章URL，防止重複翻譯同一篇文章；
+# 檢查與加入之間沒有 await，在事件迴圈中即為原子操作，不需要另外加鎖
+_in_flight_links: Set[str] = set()
 
-async def _cleanup_translation_lock(article_url: str):
-    """清理已完成的翻譯鎖"""
-    async with _translation_locks_lock:
-        if article_url in _translation_locks:
-            del _translation_locks[article_url]
+# 翻譯結果中各語言的 (標題, 內容) 欄位名稱
+_RESULT_FIELDS = {
+    language: (f"title_{language}", f"content_{language}") for language in LANGUAGE_COLUMNS
+}
+
+
+def _translation_items(
+    article_link: str,
+    translation_result: Dict[str, Any],
+    target_languages: Iterable[str]
+) -> List[Dict[str, Any]]:
+    """
+    將翻譯結果轉為 update_article_translations_bulk 的更新項目
+
+    Args:
+        article_link: 文章URL
+        translation_result: 翻譯服務回傳的結果
+        target_languages: 需要更新的語言
+
+    Returns:
+        每個語言一項的更新項目列表
+    """
+    items = []
+    for target_language in target_languages:
+        title_field, content_field = _RESULT_FIELDS[target_language]
+        items.append({
+            "article_link": article_link,
+            "target_language": target_language,
+            "title": translation_result.get(title_field),
+            "summary": translation_result.get(content_field),
+            "translation_service": "openai",
+            "success": True
+        })
+    return items
 
 
 def normalize_published_time(entry: Dict) -> str:
     """
-    標準化RSS條目的發布時間為RFC 2822格式
+    標準化RSS條目的發布時間為UTC的RFC 2822格式
     
     Args:
         entry: feedparser解析的RSS條目
@@ -50,65 +84,29 @@ def normalize_published_time(entry: Dict) -> str:
     Returns:
         標準化的RFC 2822時間字符串，如果無法解析則返回空字符串
     """
-    try:
-        # 優先使用feedparser解析的時間結構
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            # 將time.struct_time轉換為datetime，然後格式化為RFC 2822
-            dt = datetime(*entry.published_parsed[:6])
-            # RFC 2822格式: "Day, DD Mon YYYY HH:MM:SS +0000"
-            return dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-        
-        # 如果沒有parsed time，嘗試解析字符串格式的時間
-        published_str = entry.get('published', '')
-        if published_str:
-            # 嘗試解析常見的時間格式
-            try:
-                # 如果已經是RFC 2822格式，直接返回（可能需要標準化時區）
-                if re.match(r'^[A-Za-z]{3}, \d{1,2} [A-Za-z]{3} \d{4} \d{2}:\d{2}:\d{2}', published_str):
-                    # 確保時區格式統一為 +0000
-                    if published_str.endswith(' +0000') or published_str.endswith(' GMT') or published_str.endswith(' UTC'):
-                        return re.sub(r' (GMT|UTC)$', ' +0000', published_str)
-                    elif '+' in published_str or '-' in published_str[-6:]:
-                        # 保持原有時區格式
-                        return published_str
-                    else:
-                        # 如果沒有時區信息，添加 +0000
-                        return published_str + ' +0000'
-                
-                # 嘗試解析RFC 2822格式
-                try:
-                    parsed_time = time.strptime(published_str.replace(' GMT', ' +0000').replace(' UTC', ' +0000'), '%a, %d %b %Y %H:%M:%S %z')
-                    dt = datetime(*parsed_time[:6])
-                    return dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-                except ValueError:
-                    pass
-                
-                # 嘗試解析ISO 8601格式 (如: "2025-06-13T20:16:24-04:00")
-                try:
-                    # 處理不同的ISO 8601變體
-                    iso_str = published_str
-                    if 'T' in iso_str:
-                        # 移除時區信息進行基本解析
-                        time_part = iso_str.split('+')[0].split('Z')[0]
-                        if time_part.count('-') > 2:  # 包含時區的情況
-                            time_part = time_part.rsplit('-', 1)[0]
-                        dt = datetime.fromisoformat(time_part)
-                        return dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-                except ValueError:
-                    pass
-                
-                logger.warning(f"無法解析時間格式: {published_str}")
-                return ''
-                
-            except Exception as parse_error:
-                logger.warning(f"時間解析錯誤: {parse_error}, 原始時間: {published_str}")
-                return ''
-        
-        return ''
-        
-    except Exception as e:
-        logger.error(f"時間標準化錯誤: {e}")
+    # 優先使用feedparser解析的時間結構（已換算為UTC）
+    published_parsed = entry.get('published_parsed')
+    if published_parsed:
+        return format_datetime(datetime(*published_parsed[:6], tzinfo=timezone.utc))
+    
+    # 如果沒有parsed time，依序以RFC 2822與ISO 8601解析字符串格式的時間
+    published_str = entry.get('published', '').strip()
+    if not published_str:
         return ''
+    
+    try:
+        dt = parsedate_to_datetime(published_str)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
+        except ValueError:
+            logger.warning(f"無法解析時間格式: {published_str}")
+            return ''
+    
+    # 沒有時區資訊的時間視為UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc))
 
 
 def clean_html_content(content: str) -> str:
@@ -124,43 +122,65 @@ def clean_html_content(content: str) -> str:
     if not content:
         return content
     
-    # 使用正則表達式找到第一個<p>標籤的內容
-    p_pattern = r'<p[^>]*>(.*?)</p>'
-    matches = re.findall(p_pattern, content, re.DOTALL | re.IGNORECASE)
+    # 使用正則表達式找到第一個<p>標籤的內容（search 找到第一個段落即停止，不掃描整份內容）
+    match = _P_TAG_RE.search(content)
     
-    if matches:
+    if match:
         # 取第一個<p>段落的內容
-        first_p_content = matches[0]
+        first_p_content = match.group(1)
         # 移除內部的HTML標籤（如<a>標籤等）
-        clean_content = re.sub(r'<[^>]+>', '', first_p_content)
+        clean_content = _TAG_RE.sub('', first_p_content)
         # 清理多餘的空白字符
-        clean_content = re.sub(r'\s+', ' ', clean_content).strip()
+        clean_content = _WS_RE.sub(' ', clean_content).strip()
         return clean_content
     
     # 如果沒有找到<p>標籤，返回原始內容（移除所有HTML標籤）
-    clean_content = re.sub(r'<[^>]+>', '', content)
-    clean_content = re.sub(r'\s+', ' ', clean_content).strip()
+    clean_content = _TAG_RE.sub('', content)
+    clean_content = _WS_RE.sub(' ', clean_content).strip()
     return clean_content
 
 
-async def _process_entry(entry: Dict[str, str], feed_source: str, skip_translation: bool = False) -> bool:
+def _validate(link: str, title: str) -> Optional[Tuple[str, str]]:
+    """
+    在 RSS 解析邊界一次性清理並驗證文章的URL與標題
+
+    Args:
+        link: 原始文章URL
+        title: 原始標題
+
+    Returns:
+        去除空白後的 (link, title)，任一為空時返回 None
+    """
+    link = link.strip()
+    title = title.strip()
+    if not link or not title:
+        return None
+    return link, title
+
+
+def _process_entry(entry: Dict[str, str], feed_source: str) -> Optional[Tuple]:
     """
-    Insert a single RSS entry into the database with immediate translation.
-    新流程：抓取RSS → 檢查重複 → 即時翻譯 → 儲存完整資料到資料庫
+    Prepare a single RSS entry for storage (translation fields left empty).
+    新流程：抓取RSS → 檢查重複 → 由 _fetch_single_feed 整批儲存到資料庫後再整批翻譯
     
-    修復：添加全局鎖機制防止重複翻譯同一篇文章
+    重複檢查已由 _fetch_single_feed 以單次批次查詢完成，此處不再逐篇查詢資料庫
 
     Args:
         entry: An RSS entry parsed by feedparser.
         feed_source: Human-readable feed name or URL for tracking origin.
-        skip_translation: If True, skip translation and only store raw content.
 
     Returns:
-        True if the article was newly inserted, otherwise False.
+        The untranslated article row for insert_articles_bulk, or None if the entry is skipped.
     """
-    title: str = entry.get("title", "").strip()
-    link: str = entry.get("link", "").strip()
-    raw_summary: str = entry.get("summary", entry.get("description", "")).strip()
+    get = entry.get
+    validated = _validate(get("link") or "", get("title") or "")
+    if validated is None:
+        # Skip entries without a unique link or a title
+        logger.debug(f"Skipping entry without link or title: {get('title', '')}")
+        return None
+    link, title = validated
+    
+    raw_summary: str = (get("summary") or get("description") or "").strip()
     # 清理HTML內容
     summary: str = clean_html_content(raw_summary)
     
@@ -169,133 +189,142 @@ async def _process_entry(entry: Dict[str, str], feed_source: str, skip_translati
     
     # 如果標準化失敗，使用原始時間並記錄警告
     if not published:
-        raw_published = entry.get("published", "")
+        raw_published = get("published", "")
         logger.warning(f"無法標準化時間，使用原始時間: {raw_published}")
         published = raw_published
     
-    if not link:
-        # Skip entries without a unique link
-        logger.debug(f"Skipping entry without link: {title}")
-        return False
+    logger.debug(f"Processing new article: {title[:50]}...")
     
-    # 獲取該文章的專用鎖
-    article_lock = await _get_translation_lock(link)
+    # 回傳文章原始資料，由呼叫端整批寫入後再以 _translate_rows 整批翻譯
+    return (
+        link, title, summary, published, feed_source,
+        None, None, None, None, None, None
+    )
+
+
+async def _translate_rows(rows: List[Tuple]) -> List[Dict[str, Any]]:
+    """
+    以批次請求翻譯整個 feed 已寫入的新文章
     
-    async with article_lock:
-        # 在鎖內再次檢查文章是否已存在
-        if await article_exists(link):
-            logger.debug(f"Article already exists (checked under lock), skipping: {link}")
-            await _cleanup_translation_lock(link)
-            return False
-        
-        logger.debug(f"Processing new article under lock: {title[:50]}...")
-        
-        # 準備翻譯內容
-        title_zh_tw = None
-        summary_zh_tw = None
-        title_zh_cn = None
-        summary_zh_cn = None
-        title_en = None
-        summary_en = None
-        
-        # 如果不跳過翻譯，進行即時翻譯
-        if not skip_translation:
-            try:
-                logger.info(f"開始翻譯文章: {title[:50]}...")
-                service = get_translation_service()
-                translation_result = await service.translate_with_auto_detection(title, summary)
-                
-                if translation_result.get('translation_status') == 'completed':
-                    title_zh_tw = translation_result.get('title_zh_tw')
-                    summary_zh_tw = translation_result.get('content_zh_tw')
-                    title_zh_cn = translation_result.get('title_zh_cn')
-                    summary_zh_cn = translation_result.get('content_zh_cn')
-                    title_en = translation_result.get('title_en')
-                    summary_en = translation_result.get('content_en')
-                    logger.info(f"翻譯成功: {title[:50]}")
-                else:
-                    logger.warning(f"翻譯失敗，僅儲存原始資料: {title[:50]}")
-                    
-            except Exception as e:
-                logger.error(f"翻譯過程發生錯誤: {e}，僅儲存原始資料")
-        
-        # 翻譯完成後最終檢查，防止競態條件導致重複插入
-        if await article_exists(link):
-            logger.debug(f"Article was inserted by another process during translation, skipping: {link}")
-            await _cleanup_translation_lock(link)
-            return False
-        
-        # 儲存文章（包含原始資料和翻譯）
-        success = await insert_article(
-            link=link,
-            original_title=title,
-            original_summary=summary,
-            published=published,
-            feed_source=feed_source,
-            title_zh_tw=title_zh_tw,
-            summary_zh_tw=summary_zh_tw,
-            title_zh_cn=title_zh_cn,
-            summary_zh_cn=summary_zh_cn,
-            title_en=title_en,
-            summary_en=summary_en
-        )
-        
-        # 清理鎖
-        await _cleanup_translation_lock(link)
-        
-        if not success:
-            # 插入失敗可能是因為文章已存在（資料庫層面的重複檢查）
-            logger.debug(f"Article insertion failed (likely duplicate): {title}")
-            return False
+    Args:
+        rows: _process_entry 產生的文章資料列
         
-        logger.debug(f"Article successfully stored with translations: {title}")
-        return True
+    Returns:
+        update_article_translations_bulk 的翻譯更新項目（翻譯失敗的文章不產生項目，
+        留給 translate_missing_articles 補翻）
+    """
+    try:
+        logger.info(f"開始批次翻譯 {len(rows)} 篇文章...")
+        service = get_translation_service()
+        results = await service.translate_batch([(row[1], row[2]) for row in rows])
+    except Exception as e:
+        logger.error(f"翻譯過程發生錯誤: {e}，僅保留原始資料")
+        return []
+    
+    items = []
+    for row, translation_result in zip(rows, results):
+        if translation_result.get('translation_status') != 'completed':
+            logger.warning(f"翻譯失敗，僅保留原始資料: {row[1][:50]}")
+            continue
+        items.extend(_translation_items(row[0], translation_result, LANGUAGE_COLUMNS))
+        logger.info(f"翻譯成功: {row[1][:50]}")
+    return items
 
 
-async def _fetch_single_feed(url: str, skip_translation: bool = False) -> int:
+async def _download_feed(url: str) -> Optional[feedparser.FeedParserDict]:
+    """
+    Download and parse a single RSS feed.
+
+    Args:
+        url: The RSS feed URL.
+
+    Returns:
+        The parsed feed, or None if the download failed.
+    """
+    # 以非同步 HTTP 下載，等待網路時不佔用執行緒；只有解析 XML 交給執行緒
+    try:
+        response = await _get_http_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to download feed {url}: {e}")
+        return None
+    
+    # 摘要之後會由 clean_html_content 轉為純文字，不需要 feedparser 清理HTML或補全相對網址
+    # （這兩個步驟佔解析時間的大半）
+    return await asyncio.to_thread(
+        feedparser.parse,
+        response.content,
+        response_headers=dict(response.headers),
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+
+
+async def _fetch_single_feed(
+    url: str,
+    skip_translation: bool = False,
+    download_slots: Optional[asyncio.Semaphore] = None
+) -> int:
     """
-    Fetch and process a single RSS feed with immediate translation.
+    Fetch and process a single RSS feed: store new articles first, then translate them.
 
     Args:
         url: The RSS feed URL.
         skip_translation: If True, skip translation for faster processing.
+        download_slots: Optional semaphore held only while downloading and parsing, so
+                        other feeds can download while this one is being translated.
 
     Returns:
         The number of new articles inserted from this feed.
     """
     try:
-        feed_data = await asyncio.to_thread(feedparser.parse, url)
+        if download_slots is None:
+            feed_data = await _download_feed(url)
+        else:
+            async with download_slots:
+                feed_data = await _download_feed(url)
+        if feed_data is None:
+            return 0
         feed_title: str = feed_data.feed.get("title", url)
         
         logger.info(f"開始處理 RSS feed: {feed_title} ({len(feed_data.entries)} 篇文章)")
         
-        # 進一步降低並發控制，確保翻譯過程的穩定性
-        if skip_translation:
-            semaphore = asyncio.Semaphore(2)  # 不翻譯時降低並發
-        else:
-            # 翻譯時完全序列化處理，配合全局鎖機制
-            semaphore = asyncio.Semaphore(1)
-        
-        async def process_with_semaphore(entry):
-            async with semaphore:
+        # 先認領本 feed 中未被其他 feed 處理中的文章，再查詢資料庫：
+        # 其他 feed 釋放認領時已完成寫入，之後的查詢一定看得到，不會重複翻譯同一篇文章
+        # 每篇文章的URL只取出並清理一次，認領與逐篇處理共用
+        entry_links = [(entry.get("link") or "").strip() for entry in feed_data.entries]
+        claimed_links = {link for link in entry_links if link not in _in_flight_links}
+        _in_flight_links.update(claimed_links)
+        try:
+            # 一次查出已存在於資料庫的文章（單次 SELECT ... IN），之後只處理其餘文章
+            existing_links = await article_exists_many(list(claimed_links))
+            
+            # 序列處理所有文章，同一個 feed 內重複出現的文章只處理一次
+            rows = []
+            seen_links = set()
+            for entry, link in zip(feed_data.entries, entry_links):
                 try:
-                    return await _process_entry(entry, feed_title, skip_translation)
+                    if link not in claimed_links or link in existing_links or link in seen_links:
+                        continue
+                    seen_links.add(link)
+                    row = _process_entry(entry, feed_title)
+                    if row:
+                        rows.append(row)
                 except Exception as e:
-                    logger.error(f"處理文章時發生錯誤: {e}")
-                    return False
-        
-        # 序列處理所有文章，避免同時處理相同文章
-        successful_inserts = 0
-        for entry in feed_data.entries:
-            try:
-                result = await process_with_semaphore(entry)
-                if result:
-                    successful_inserts += 1
-                # 在翻譯模式下添加延遲，避免API速率限制
-                if not skip_translation:
-                    await asyncio.sleep(0.5)
-            except Exception as e:
-                logger.error(f"Error processing entry from {url}: {e}")
+                    logger.error(f"Error processing entry from {url}: {e}")
+            
+            # 先將整個 feed 的新文章（僅原始資料）一次性寫入資料庫，不必等待翻譯即可顯示
+            # _process_entry 已透過 _validate 驗證URL與標題，資料庫端不必逐列重複檢查
+            successful_inserts = await insert_articles_bulk(rows, validated=True)
+            
+            # 再以少量批次請求翻譯，完成後一次更新所有語言版本
+            if rows and not skip_translation:
+                items = await _translate_rows(rows)
+                if items:
+                    await update_article_translations_bulk(items)
+        finally:
+            # 翻譯完成（或失敗）後釋放認領的文章，期間 translate_missing_articles 會略過這些文章
+            _in_flight_links.difference_update(claimed_links)
         
         logger.info(f"完成處理 RSS feed: {feed_title} (新增 {successful_inserts} 篇文章)")
         return successful_inserts
@@ -306,8 +335,37 @@ async def _fetch_single_feed(url: str, skip_translation: bool = False) -> int:
 
 
 # 全局執行狀態控制
-_fetch_in_progress = False
-_fetch_lock = asyncio.Lock()
+# 所有程式碼都在同一個事件迴圈執行緒上，檢查與設定之間沒有 await，不需要另外加鎖
+_fetch_busy = asyncio.Event()
+
+# 同時下載的 RSS 源數量上限
+_FEED_CONCURRENCY = 8
+
+# RSS 下載共用的非同步 HTTP 連線池（第一次使用時建立，應用程式關閉時由 close_http_client 釋放）
+_FEED_TIMEOUT = 15.0
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """獲取共用的 HTTP 客戶端"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(_FEED_TIMEOUT),
+            limits=httpx.Limits(max_connections=50),
+            follow_redirects=True,
+            # 沿用 feedparser 自行下載時的 User-Agent，避免被部分來源拒絕
+            headers={"User-Agent": feedparser.USER_AGENT},
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """關閉共用的 HTTP 客戶端"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 async def fetch_all_feeds(skip_translation: bool = False) -> Dict[str, int]:
     """
@@ -321,35 +379,37 @@ async def fetch_all_feeds(skip_translation: bool = False) -> Dict[str, int]:
     Returns:
         Dictionary with the total number of new articles inserted.
     """
-    global _fetch_in_progress
-    
-    async with _fetch_lock:
-        if _fetch_in_progress:
-            logger.warning("RSS 抓取任務已在執行中，跳過此次請求")
-            return {"error": "RSS 抓取任務已在執行中", "new_articles": 0}
-        
-        _fetch_in_progress = True
+    if _fetch_busy.is_set():
+        logger.warning("RSS 抓取任務已在執行中，跳過此次請求")
+        return {"error": "RSS 抓取任務已在執行中", "new_articles": 0}
+    _fetch_busy.set()
     
     try:
         logger.info(f"開始抓取所有 RSS feeds (共 {len(FEEDS)} 個源)")
         total_new = 0
         failed_feeds = []
         
-        # 序列處理所有 feeds，避免同時處理造成重複
-        for i, url in enumerate(FEEDS, 1):
-            try:
-                logger.info(f"處理第 {i}/{len(FEEDS)} 個 RSS 源: {url}")
-                new_count = await _fetch_single_feed(url, skip_translation)
-                total_new += new_count
-                logger.info(f"完成第 {i}/{len(FEEDS)} 個源，新增 {new_count} 篇文章")
-                
-                # 在處理不同 feeds 之間添加短暫延遲
-                if i < len(FEEDS):
-                    await asyncio.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"Failed to process feed {url}: {e}")
+        # 各 feed 互不相關，以有限的並發同時下載；下載完成即釋放名額，
+        # 翻譯（並發由翻譯服務控制）與其他 feed 的下載同時進行，形成管線
+        # _in_flight_links 避免跨 feed 重複處理同一篇文章
+        download_slots = asyncio.Semaphore(_FEED_CONCURRENCY)
+        
+        async def fetch_feed(i: int, url: str) -> int:
+            logger.info(f"處理第 {i}/{len(FEEDS)} 個 RSS 源: {url}")
+            new_count = await _fetch_single_feed(url, skip_translation, download_slots)
+            logger.info(f"完成第 {i}/{len(FEEDS)} 個源，新增 {new_count} 篇文章")
+            return new_count
+        
+        results = await asyncio.gather(
+            *(fetch_feed(i, url) for i, url in enumerate(FEEDS, 1)),
+            return_exceptions=True
+        )
+        for url, new_count in zip(FEEDS, results):
+            if isinstance(new_count, Exception):
+                logger.error(f"Failed to process feed {url}: {new_count}")
                 failed_feeds.append(url)
+            else:
+                total_new += new_count
         
         result = {"new_articles": total_new}
         if failed_feeds:
@@ -359,8 +419,7 @@ async def fetch_all_feeds(skip_translation: bool = False) -> Dict[str, int]:
         return result
         
     finally:
-        async with _fetch_lock:
-            _fetch_in_progress = False
+        _fetch_busy.clear()
 
 
 async def translate_missing_articles(limit: Optional[int] = None) -> Dict[str, int]:
@@ -375,76 +434,44 @@ async def translate_missing_articles(limit: Optional[int] = None) -> Dict[str, i
         翻譯結果統計
     """
     try:
-        from .db import fetch_articles_for_translation, update_article_translation
-        
-        # 獲取需要翻譯的文章
-        articles_to_translate = []
-        
-        # 按優先級獲取需要翻譯的文章
-        for lang in ["zh_tw", "zh_cn", "en"]:
-            if limit is None or len(articles_to_translate) < limit:
-                remaining_limit = None if limit is None else limit - len(articles_to_translate)
-                articles = await fetch_articles_for_translation(lang, remaining_limit)
-                articles_to_translate.extend([(article, lang) for article in articles])
+        # 以單一查詢獲取缺少翻譯的文章及其缺少的語言；
+        # 同一篇文章可能缺少多個語言，一次翻譯即可取得所有語言版本
+        articles_to_translate = await fetch_missing_translations(limit)
         
         if not articles_to_translate:
             return {"message": "No articles need translation", "processed": 0}
         
-        logger.info(f"開始翻譯 {len(articles_to_translate)} 篇未翻譯的文章")
+        # 正在由 RSS 抓取流程翻譯的文章不重複翻譯
+        pending = [
+            (article, target_languages) for article, target_languages in articles_to_translate
+            if article['link'] not in _in_flight_links
+        ]
         
-        service = get_translation_service()
-        successful_updates = 0
-        failed_updates = 0
+        logger.info(f"開始翻譯 {len(pending)} 篇未翻譯的文章")
         
-        for article, target_language in articles_to_translate:
-            try:
-                logger.info(f"翻譯文章到 {target_language}: {article['original_title'][:50]}...")
-                
-                translation_result = await service.translate_with_auto_detection(
-                    article['original_title'],
-                    article['original_summary'] or ""
-                )
-                
-                if translation_result.get('translation_status') == 'completed':
-                    # 根據目標語言選擇翻譯結果
-                    if target_language == "zh_tw":
-                        title = translation_result.get('title_zh_tw')
-                        summary = translation_result.get('content_zh_tw')
-                    elif target_language == "zh_cn":
-                        title = translation_result.get('title_zh_cn')
-                        summary = translation_result.get('content_zh_cn')
-                    else:  # en
-                        title = translation_result.get('title_en')
-                        summary = translation_result.get('content_en')
-                    
-                    success = await update_article_translation(
-                        article_link=article['link'],
-                        target_language=target_language,
-                        title=title,
-                        summary=summary,
-                        translation_service="openai",
-                        success=True
-                    )
-                    
-                    if success:
-                        successful_updates += 1
-                        logger.info(f"成功翻譯文章: {article['original_title'][:50]}")
-                    else:
-                        failed_updates += 1
-                        logger.error(f"更新資料庫失敗: {article['link']}")
-                else:
-                    failed_updates += 1
-                    logger.error(f"翻譯失敗: {article['original_title'][:50]}")
-                
-                # API速率限制
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"翻譯文章時發生錯誤 {article['link']}: {e}")
-                failed_updates += 1
+        # 多篇文章合併為少量批次請求翻譯（API 速率限制與並發由翻譯服務統一控制）
+        service = get_translation_service()
+        translations = await service.translate_batch([
+            (article['original_title'], article['original_summary'] or "")
+            for article, _ in pending
+        ])
+        
+        items = []
+        for (article, target_languages), translation_result in zip(pending, translations):
+            if translation_result.get('translation_status') != 'completed':
+                logger.error(f"翻譯失敗: {article['original_title'][:50]}")
+                continue
+            items.extend(_translation_items(article['link'], translation_result, target_languages))
+        
+        # 所有文章缺少的語言在同一次寫入中更新
+        total = sum(len(target_languages) for _, target_languages in pending)
+        successful_updates = await update_article_translations_bulk(items) if items else 0
+        failed_updates = total - successful_updates
+        if len(items) > successful_updates:
+            logger.error(f"部分翻譯更新資料庫失敗: {len(items) - successful_updates} 筆")
         
         return {
-            "processed": len(articles_to_translate),
+            "processed": total,
             "successful": successful_updates,
             "failed": failed_updates
         }
@@ -5,6 +5,9 @@
 
 import asyncio
 import logging
+import os
+import socket
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -12,24 +15,41 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
-from .rss_fetcher import fetch_and_store_news, translate_missing_articles
-from .db import get_translation_stats
+from .rss_fetcher import fetch_and_store_news, translate_missing_articles, refresh_feeds_fast
+from .db import (
+    get_translation_stats,
+    ensure_url_uniqueness,
+    delete_old_articles,
+    delete_old_translation_cache,
+    try_acquire_job_lock,
+    release_job_lock,
+)
 
 # 設置日誌
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 跨行程的抓取任務鎖：有效時間需長於一次完整抓取，持有者異常終止時最多延遲這麼久
+_FETCH_LOCK_NAME = 'fetch_news'
+_FETCH_LOCK_TTL = 30 * 60
+
 class NewsScheduler:
     """新聞自動化調度器"""
     
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+        # 所有任務共用的預設值：錯過的多次執行只補跑一次、延遲5分鐘內仍執行、同一任務不重疊執行
+        self.scheduler = AsyncIOScheduler(job_defaults={
+            'coalesce': True,
+            'misfire_grace_time': 300,
+            'max_instances': 1,
+        })
         self.is_running = False
         self.last_fetch_time: Optional[datetime] = None
         self.last_fetch_result: Optional[Dict[str, Any]] = None
         self.fetch_enabled = True
         self.translation_enabled = True
         self._fetch_in_progress = False  # 添加執行狀態標記
+        self._lock_owner = f"{socket.gethostname()}:{os.getpid()}"
         
         # 設置事件監聽器
         self.scheduler.add_listener(self._job_executed, EVENT_JOB_EXECUTED)
@@ -57,10 +77,22 @@ class NewsScheduler:
         if self._fetch_in_progress:
             logger.warning("上一次抓取任務仍在執行中，跳過此次執行")
             return
+        
+        # 多個行程共用資料庫時，由取得任務鎖的行程執行
+        self._fetch_in_progress = True
+        try:
+            acquired = await try_acquire_job_lock(_FETCH_LOCK_NAME, self._lock_owner, _FETCH_LOCK_TTL)
+        except Exception as e:
+            logger.error(f"取得抓取任務鎖失敗: {str(e)}")
+            acquired = False
+        if not acquired:
+            self._fetch_in_progress = False
+            logger.warning("其他行程正在執行抓取任務，跳過此次執行")
+            return
             
         try:
-            self._fetch_in_progress = True
             start_time = datetime.now()
+            started = time.monotonic()  # 耗時以單調時鐘計算，不受系統時間調整影響
             logger.info(f"開始自動抓取新聞（包含即時翻譯）... 開始時間: {start_time}")
             
             # 根據翻譯設定決定是否進行即時翻譯
@@ -69,13 +101,11 @@ class NewsScheduler:
                 result = await fetch_and_store_news()
             else:
                 logger.info("執行快速抓取流程（跳過翻譯）")
-                from .rss_fetcher import refresh_feeds_fast
                 result = await refresh_feeds_fast()
             
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - started
             
-            self.last_fetch_time = end_time
+            self.last_fetch_time = datetime.now()
             self.last_fetch_result = result
             
             logger.info(f"新聞抓取完成，耗時 {duration:.2f} 秒: {result}")
@@ -84,6 +114,10 @@ class NewsScheduler:
             logger.error(f"自動抓取新聞失敗: {str(e)}")
             self.last_fetch_result = {"error": str(e)}
         finally:
+            try:
+                await release_job_lock(_FETCH_LOCK_NAME, self._lock_owner)
+            except Exception as e:
+                logger.error(f"釋放抓取任務鎖失敗: {str(e)}")
             self._fetch_in_progress = False
             logger.info("抓取任務執行狀態已重置")
     
@@ -91,10 +125,10 @@ class NewsScheduler:
         """定期清理任務（每小時執行一次）"""
         try:
             logger.info("開始定期清理任務...")
-            from .db import ensure_url_uniqueness, delete_old_articles
             result = await ensure_url_uniqueness()
             deleted_count = await delete_old_articles(7)
-            logger.info(f"清理完成: {result}，刪除7天前新聞數量: {deleted_count}")
+            deleted_cache = await delete_old_translation_cache(30)
+            logger.info(f"清理完成: {result}，刪除7天前新聞數量: {deleted_count}，刪除30天前翻譯快取數量: {deleted_cache}")
         except Exception as e:
             logger.error(f"定期清理失敗: {str(e)}")
     
@@ -111,8 +145,7 @@ class NewsScheduler:
                 trigger=IntervalTrigger(minutes=10),
                 id='fetch_news',
                 name='自動抓取新聞',
-                replace_existing=True,
-                max_instances=1  # 防止重複執行
+                replace_existing=True
             )
             
             # 添加清理任務（每小時）
@@ -121,8 +154,7 @@ class NewsScheduler:
                 trigger=IntervalTrigger(hours=1),
                 id='cleanup',
                 name='定期清理',
-                replace_existing=True,
-                max_instances=1
+                replace_existing=True
             )
             
             self.scheduler.start()
@@ -1,16 +1,160 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
+import random
 import re
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple, List
 import logging
 
-from openai import AsyncOpenAI
+import httpx
+import orjson
+from openai import (
+    AsyncOpenAI,
+    AuthenticationError,
+    BadRequestError,
+    NotFoundError,
+    PermissionDeniedError,
+)
+
+from .db import fully_translated_links, get_cached_translations, put_cached_translations
 
 logger = logging.getLogger(__name__)
 
+# 批次翻譯：每個請求最多包含的文章數量
+_BATCH_TRANSLATION_SIZE = 8
+# 每個請求的原文字數上限，避免篇幅較長的文章使回應超過 token 上限
+_BATCH_MAX_CHARS = 4000
+
+# 回應 token 上限依原文長度估算：每個原文字元在每個輸出語言約需 1 個 token（中文接近 1:1，
+# 英文譯成中文時更少），再加上 JSON 欄位的固定開銷；長文不會被截斷，短文也不必預留固定的大量額度
+_OUTPUT_TOKENS_OVERHEAD = 256
+_MIN_OUTPUT_TOKENS = 512
+_MAX_OUTPUT_TOKENS = 16000
+
+# 單次 API 呼叫的逾時秒數（重試由本模組控制，不使用 SDK 內建的重試）：非串流回應要等全部
+# token 產生完才會送回，讀取逾時以基本秒數加上以保守產生速度估算的時間，長篇批次也不會因逾時而重試
+_API_TIMEOUT = 30.0
+_API_CONNECT_TIMEOUT = 5.0
+_MIN_OUTPUT_TOKENS_PER_SECOND = 40.0
+
+# 重試也不會成功的錯誤（請求內容、金鑰或權限問題），遇到時直接放棄
+_TERMINAL_ERRORS = (BadRequestError, AuthenticationError, PermissionDeniedError, NotFoundError)
+
+# 沒有任何文字字元（只有空白、標點或符號）的文章不值得呼叫 API 翻譯
+_WORD_RE = re.compile(r'\w')
+
+# 純英文文章（只有 ASCII 字母與常見標點）：英文版本即為原文，只需請模型產生兩種中文版本
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+_NON_ENGLISH_RE = re.compile(r'[^\x00-\x7f\u00a0\u2000-\u206f]')
+
+# 翻譯結果快取：相同標題與內容（例如聚合來源轉載的文章）只翻譯一次
+_TRANSLATION_CACHE_SIZE = 4096
+
+# 單篇翻譯的系統提示及其訊息（所有請求共用同一個物件，不必每次重新建立）
+_SYSTEM_PROMPT = """你是一個專業的多語言翻譯專家。請分析給定的文本，自動檢測其語言，然後根據以下規則進行翻譯：
+
+1. 如果是繁體中文 → 翻譯成英文 + 簡體中文
+2. 如果是英文 → 翻譯成繁體中文 + 簡體中文
+3. 如果是簡體中文 → 翻譯成繁體中文 + 英文
+
+請以JSON格式回應，包含以下欄位：
+- original_language: 檢測到的原始語言 ("zh-tw", "en", "zh-cn", "other")
+- title_zh_tw: 繁體中文標題（不要包含語言標籤）
+- title_en: 英文標題（不要包含語言標籤）
+- title_zh_cn: 簡體中文標題（不要包含語言標籤）
+- content_zh_tw: 繁體中文內容（不要包含語言標籤）
+- content_en: 英文內容（不要包含語言標籤）
+- content_zh_cn: 簡體中文內容（不要包含語言標籤）
+
+重要：翻譯結果中不要包含任何語言標籤（如「原始语言: en」等），只提供純粹的翻譯內容。確保翻譯自然流暢，保持原文的語調和風格。"""
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+_BATCH_SYSTEM_PROMPT = """你是一個專業的多語言翻譯專家。你會收到一個JSON陣列，每個元素是一篇文章（id、title、content）。請分別分析每篇文章，自動檢測其語言，然後根據以下規則進行翻譯：
+
+1. 如果是繁體中文 → 翻譯成英文 + 簡體中文
+2. 如果是英文 → 翻譯成繁體中文 + 簡體中文
+3. 如果是簡體中文 → 翻譯成繁體中文 + 英文
+
+請以JSON格式回應：{"articles": [...]}，陣列中每篇文章一個物件，包含以下欄位：
+- id: 與輸入相同的文章id
+- original_language: 檢測到的原始語言 ("zh-tw", "en", "zh-cn", "other")
+- title_zh_tw: 繁體中文標題（不要包含語言標籤）
+- title_en: 英文標題（不要包含語言標籤）
+- title_zh_cn: 簡體中文標題（不要包含語言標籤）
+- content_zh_tw: 繁體中文內容（不要包含語言標籤）
+- content_en: 英文內容（不要包含語言標籤）
+- content_zh_cn: 簡體中文內容（不要包含語言標籤）
+
+重要：每篇文章都必須出現在回應中。翻譯結果中不要包含任何語言標籤，只提供純粹的翻譯內容。確保翻譯自然流暢，保持原文的語調和風格。"""
+_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": _BATCH_SYSTEM_PROMPT}
+
+# 純英文文章使用的較短提示：不要求英文欄位（由原文填入），減少約三分之一的輸出 token
+_EN_SYSTEM_PROMPT = """你是一個專業的翻譯專家。請將給定的英文文本翻譯成繁體中文和簡體中文。
+
+請以JSON格式回應，包含以下欄位：
+- title_zh_tw: 繁體中文標題（不要包含語言標籤）
+- title_zh_cn: 簡體中文標題（不要包含語言標籤）
+- content_zh_tw: 繁體中文內容（不要包含語言標籤）
+- content_zh_cn: 簡體中文內容（不要包含語言標籤）
+
+重要：翻譯結果中不要包含任何語言標籤，只提供純粹的翻譯內容。確保翻譯自然流暢，保持原文的語調和風格。"""
+_EN_SYSTEM_MESSAGE = {"role": "system", "content": _EN_SYSTEM_PROMPT}
+
+_EN_BATCH_SYSTEM_PROMPT = """你是一個專業的翻譯專家。你會收到一個JSON陣列，每個元素是一篇英文文章（id、title、content）。請將每篇文章翻譯成繁體中文和簡體中文。
+
+請以JSON格式回應：{"articles": [...]}，陣列中每篇文章一個物件，包含以下欄位：
+- id: 與輸入相同的文章id
+- title_zh_tw: 繁體中文標題（不要包含語言標籤）
+- title_zh_cn: 簡體中文標題（不要包含語言標籤）
+- content_zh_tw: 繁體中文內容（不要包含語言標籤）
+- content_zh_cn: 簡體中文內容（不要包含語言標籤）
+
+重要：每篇文章都必須出現在回應中。翻譯結果中不要包含任何語言標籤，只提供純粹的翻譯內容。確保翻譯自然流暢，保持原文的語調和風格。"""
+_EN_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": _EN_BATCH_SYSTEM_PROMPT}
+
+
+def _is_english(title: str, content: str) -> bool:
+    """
+    判斷文章是否為純英文（含 ASCII 字母且沒有 ASCII 與常見標點以外的字元）
+    
+    中文文章的繁簡判斷交由模型處理，這裡只挑出可以確定的英文文章
+    """
+    return (
+        bool(_ASCII_LETTER_RE.search(title) or _ASCII_LETTER_RE.search(content))
+        and not _NON_ENGLISH_RE.search(title)
+        and not _NON_ENGLISH_RE.search(content)
+    )
+
+
+def _estimate_output_tokens(title: str, content: str, english: bool) -> int:
+    """
+    估算翻譯一篇文章所需的回應 token 數
+    
+    純英文文章只輸出兩種中文版本，其他文章輸出三種語言版本
+    """
+    languages = 2 if english else 3
+    return _OUTPUT_TOKENS_OVERHEAD + languages * (len(title) + len(content))
+
+
+def _request_timeout(max_tokens: int) -> httpx.Timeout:
+    """依回應 token 上限計算單次請求的逾時設定"""
+    return httpx.Timeout(
+        _API_TIMEOUT + max_tokens / _MIN_OUTPUT_TOKENS_PER_SECOND,
+        connect=_API_CONNECT_TIMEOUT,
+    )
+
+
+def _fill_english_source(result: Dict[str, str], title: str, content: str) -> Dict[str, str]:
+    """純英文文章的翻譯結果：原始語言為英文，英文欄位直接使用原文"""
+    result['original_language'] = 'en'
+    result['title_en'] = title or None
+    result['content_en'] = content or None
+    return result
+
 
 class TranslationService:
     """優化的OpenAI翻譯服務類別"""
@@ -26,28 +170,114 @@ class TranslationService:
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # OpenAI 客戶端在第一次呼叫 API 時才建立
+        self._client: Optional[AsyncOpenAI] = None
         self.model = "gpt-4o-mini"  # 使用更經濟的模型
         
-        # API速率限制控制
-        self.last_api_call = 0
-        self.min_interval = 1.0  # 最小間隔1秒
+        # API速率限制控制（令牌桶）：每秒補充 rate_limit 個請求額度，最多累積 rate_burst 個，
+        # 閒置後允許短時間的突發請求，長期平均速率仍不超過 rate_limit
+        self.rate_limit = float(os.getenv("TRANSLATE_RATE_LIMIT", "5"))
+        self.rate_burst = float(os.getenv("TRANSLATE_RATE_BURST", "10"))
+        self._tokens = self.rate_burst
+        self._last_refill = time.monotonic()
         self.max_retries = 3
         self.retry_delay = 2.0
         
+        # 批次翻譯時同時進行的請求數量上限
+        self.concurrency = int(os.getenv("TRANSLATE_CONCURRENCY", "8"))
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        
+        # 已完成翻譯的結果（LRU），鍵為內容雜湊
+        self._cache: OrderedDict[bytes, Dict[str, str]] = OrderedDict()
+        # 翻譯中的內容，其他呼叫端等待同一個結果而不重複呼叫 API
+        self._in_flight: Dict[bytes, asyncio.Future] = {}
+    
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI 客戶端（第一次使用時建立）"""
+        if self._client is None:
+            # 連線池大小配合並發上限，並發請求都能重用保持連線（keep-alive），不必重新進行 TLS 交握
+            http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(_API_TIMEOUT, connect=_API_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.concurrency * 2,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=http_client, max_retries=0)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """關閉 OpenAI 客戶端及其連線池"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+    
+    def _cache_key(self, title: str, content: str) -> bytes:
+        """以模型、標題與內容計算快取鍵"""
+        return hashlib.blake2b(f"{self.model}\x00{title}\x00{content}".encode(), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, str]]:
+        """取得快取的翻譯結果（回傳副本，避免呼叫端修改快取內容）"""
+        result = self._cache.get(key)
+        if result is None:
+            return None
+        self._cache.move_to_end(key)
+        return dict(result)
+    
+    def _cache_put(self, key: bytes, result: Dict[str, str]) -> None:
+        """儲存成功的翻譯結果，超過上限時移除最久未使用的項目"""
+        if result.get('translation_status') != 'completed':
+            return
+        self._cache[key] = dict(result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > _TRANSLATION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    async def _load_persisted(self, keys: List[bytes]) -> Dict[bytes, Dict[str, str]]:
+        """從資料庫讀取持久化的翻譯結果；資料庫無法使用時視為全部未命中"""
+        if not keys:
+            return {}
+        try:
+            cached = await get_cached_translations(keys)
+        except Exception as e:
+            logger.warning(f"Failed to read translation cache: {e}")
+            return {}
+        return {key: orjson.loads(result) for key, result in cached.items()}
+    
+    async def _store_persisted(self, items: List[Tuple[bytes, Dict[str, str]]]) -> None:
+        """將完成的翻譯結果寫入資料庫；寫入失敗不影響翻譯結果"""
+        if not items:
+            return
+        try:
+            await put_cached_translations([(key, orjson.dumps(result).decode()) for key, result in items])
+        except Exception as e:
+            logger.warning(f"Failed to write translation cache: {e}")
+    
+    async def _retry_wait(self, attempt: int) -> None:
+        """重試前等待：full-jitter 指數退避，避免並發的失敗請求同時重試"""
+        await asyncio.sleep(random.uniform(0, self.retry_delay * 2 ** attempt))
     
     async def _rate_limit_wait(self):
-        """API速率限制控制"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_call
-        if time_since_last < self.min_interval:
-            await asyncio.sleep(self.min_interval - time_since_last)
-        self.last_api_call = time.time()
+        """
+        API速率限制控制：取用一個令牌桶額度，額度不足時等待補充
+        
+        額度可以預支為負數，並發呼叫會依序排定各自的等待時間；
+        計算與扣除之間沒有 await，不需要加鎖
+        """
+        now = time.monotonic()
+        self._tokens = min(self.rate_burst, self._tokens + (now - self._last_refill) * self.rate_limit)
+        self._last_refill = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate_limit)
     
     async def translate_with_auto_detection(self, title: str, content: str) -> Dict[str, str]:
         """
         使用AI自動檢測語言並翻譯文章
         
+        已翻譯過的內容直接回傳快取結果，相同內容的並發請求共用同一次 API 呼叫
+        
         Args:
             title: 文章標題
             content: 文章內容
@@ -55,76 +285,250 @@ class TranslationService:
         Returns:
             包含翻譯結果的字典
         """
-        if not title and not content:
-            return {
-                'original_language': 'unknown',
-                'title_zh_tw': None,
-                'title_en': None,
-                'title_zh_cn': None,
-                'content_zh_tw': None,
-                'content_en': None,
-                'content_zh_cn': None,
-                'translation_status': 'failed'
-            }
+        return (await self.translate_batch([(title, content)]))[0]
+    
+    async def _translate_single(self, title: str, content: str) -> Dict[str, str]:
+        """
+        以單一請求翻譯一篇文章（不經過快取）
+        """
+        if not self._is_translatable(title, content):
+            return self._untranslatable_result(title, content)
+        
+        # 組合文本用於語言檢測和翻譯（重試時沿用）
+        combined_text = f"標題: {title}\n內容: {content}" if title and content else (title or content)
+        user_prompt = f"請分析並翻譯以下文本：\n\n{combined_text}"
+        english = _is_english(title, content)
+        system_message = _EN_SYSTEM_MESSAGE if english else _SYSTEM_MESSAGE
+        max_tokens = min(_MAX_OUTPUT_TOKENS, max(_MIN_OUTPUT_TOKENS, _estimate_output_tokens(title, content, english)))
             
         for attempt in range(self.max_retries):
             try:
                 await self._rate_limit_wait()
                 
-                # 組合文本用於語言檢測和翻譯
-                combined_text = f"標題: {title}\n內容: {content}" if title and content else (title or content)
-                
-                system_prompt = """你是一個專業的多語言翻譯專家。請分析給定的文本，自動檢測其語言，然後根據以下規則進行翻譯：
-
-1. 如果是繁體中文 → 翻譯成英文 + 簡體中文
-2. 如果是英文 → 翻譯成繁體中文 + 簡體中文
-3. 如果是簡體中文 → 翻譯成繁體中文 + 英文
-
-請以JSON格式回應，包含以下欄位：
-- original_language: 檢測到的原始語言 ("zh-tw", "en", "zh-cn", "other")
-- title_zh_tw: 繁體中文標題（不要包含語言標籤）
-- title_en: 英文標題（不要包含語言標籤）
-- title_zh_cn: 簡體中文標題（不要包含語言標籤）
-- content_zh_tw: 繁體中文內容（不要包含語言標籤）
-- content_en: 英文內容（不要包含語言標籤）
-- content_zh_cn: 簡體中文內容（不要包含語言標籤）
-
-重要：翻譯結果中不要包含任何語言標籤（如「原始语言: en」等），只提供純粹的翻譯內容。確保翻譯自然流暢，保持原文的語調和風格。"""
-
-                user_prompt = f"請分析並翻譯以下文本：\n\n{combined_text}"
-                
                 response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=[
-                        {"role": "system", "content": system_prompt},
+                        system_message,
                         {"role": "user", "content": user_prompt}
                     ],
-                    max_tokens=3000,
+                    max_tokens=max_tokens,
                     temperature=0.3,
+                    timeout=_request_timeout(max_tokens),
                     response_format={"type": "json_object"}
                 )
                 
-                import json
-                result = json.loads(response.choices[0].message.content)
+                result = orjson.loads(response.choices[0].message.content)
+                if english:
+                    _fill_english_source(result, title, content)
                 result['translation_status'] = 'completed'
                 return result
                 
+            except _TERMINAL_ERRORS as e:
+                logger.error(f"Translation failed with non-retryable error: {e}")
+                return self._failed_result(title, content)
             except Exception as e:
                 logger.warning(f"Translation attempt {attempt + 1} failed: {e}")
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    await self._retry_wait(attempt)
                 else:
                     logger.error(f"Translation failed after {self.max_retries} attempts: {e}")
-                    return {
-                        'original_language': 'unknown',
-                        'title_zh_tw': title if title else None,
-                        'title_en': title if title else None,
-                        'title_zh_cn': title if title else None,
-                        'content_zh_tw': content if content else None,
-                        'content_en': content if content else None,
-                        'content_zh_cn': content if content else None,
-                        'translation_status': 'failed'
-                    }
+                    return self._failed_result(title, content)
+    
+    @staticmethod
+    def _is_translatable(title: str, content: str) -> bool:
+        """標題或內容至少包含一個文字字元時才需要翻譯"""
+        return bool(_WORD_RE.search(title or "") or _WORD_RE.search(content or ""))
+    
+    @staticmethod
+    def _untranslatable_result(title: str, content: str) -> Dict[str, str]:
+        """不需翻譯的文章（空白或只有符號）的結果：不呼叫 API，各語言欄位沿用去除空白後的原文"""
+        title = (title or "").strip() or None
+        content = (content or "").strip() or None
+        return {
+            'original_language': 'unknown',
+            'title_zh_tw': title,
+            'title_en': title,
+            'title_zh_cn': title,
+            'content_zh_tw': content,
+            'content_en': content,
+            'content_zh_cn': content,
+            'translation_status': 'failed'
+        }
+    
+    @staticmethod
+    def _failed_result(title: str, content: str) -> Dict[str, str]:
+        """翻譯失敗時的結果：各語言欄位以原文填入"""
+        return {
+            'original_language': 'unknown',
+            'title_zh_tw': title if title else None,
+            'title_en': title if title else None,
+            'title_zh_cn': title if title else None,
+            'content_zh_tw': content if content else None,
+            'content_en': content if content else None,
+            'content_zh_cn': content if content else None,
+            'translation_status': 'failed'
+        }
+    
+    async def translate_batch(self, articles: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        以少量請求翻譯多篇文章：每個請求包含最多 _BATCH_TRANSLATION_SIZE 篇文章、
+        合計約 _BATCH_MAX_CHARS 個字元（單篇超過上限時獨立成一個請求）
+        
+        Args:
+            articles: (標題, 內容) 列表
+            
+        Returns:
+            與輸入順序相同的翻譯結果列表，格式與 translate_with_auto_detection 相同
+        """
+        results: List[Optional[Dict[str, str]]] = [None] * len(articles)
+        # 快取未命中的文章，相同內容只送出一次；已由其他呼叫翻譯中的內容等待其結果
+        pending: Dict[bytes, List[int]] = {}
+        waiting: Dict[bytes, Tuple[asyncio.Future, List[int]]] = {}
+        for i, (title, content) in enumerate(articles):
+            if not self._is_translatable(title, content):
+                results[i] = self._untranslatable_result(title, content)
+                continue
+            key = self._cache_key(title, content)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            elif key in pending:
+                pending[key].append(i)
+            elif key in waiting:
+                waiting[key][1].append(i)
+            elif key in self._in_flight:
+                waiting[key] = (self._in_flight[key], [i])
+            else:
+                pending[key] = [i]
+        
+        loop = asyncio.get_running_loop()
+        for key in pending:
+            self._in_flight[key] = loop.create_future()
+        
+        def complete(key: bytes, result: Dict[str, str]) -> None:
+            self._cache_put(key, result)
+            self._in_flight.pop(key).set_result(result)
+            for i in pending[key]:
+                results[i] = dict(result)
+        
+        try:
+            # 記憶體快取未命中的內容再以單次查詢檢查資料庫中的持久化快取
+            for key, result in (await self._load_persisted(list(pending))).items():
+                complete(key, result)
+            to_translate = [key for key in pending if key in self._in_flight]
+            
+            # 純英文文章與其他文章分開分組（使用不同的提示），
+            # 各組依篇數與字數上限切分，以有限的並發同時送出
+            chunks: List[Tuple[bool, List[bytes]]] = []
+            for english in (True, False):
+                chunk_chars = 0
+                group_start = len(chunks)
+                for key in to_translate:
+                    title, content = articles[pending[key][0]]
+                    if _is_english(title, content) != english:
+                        continue
+                    chars = len(title) + len(content)
+                    if (len(chunks) > group_start and len(chunks[-1][1]) < _BATCH_TRANSLATION_SIZE
+                            and chunk_chars + chars <= _BATCH_MAX_CHARS):
+                        chunks[-1][1].append(key)
+                        chunk_chars += chars
+                    else:
+                        chunks.append((english, [key]))
+                        chunk_chars = chars
+            
+            async def translate_chunk(english: bool, chunk_keys: List[bytes]) -> List[Dict[str, str]]:
+                async with self._semaphore:
+                    return await self._translate_chunk([articles[pending[key][0]] for key in chunk_keys], english)
+            
+            outcomes = await asyncio.gather(*(translate_chunk(*chunk) for chunk in chunks), return_exceptions=True)
+            translated = []
+            for (_, chunk_keys), chunk_results in zip(chunks, outcomes):
+                if isinstance(chunk_results, Exception):
+                    logger.error(f"Batch translation failed: {chunk_results}")
+                    chunk_results = [self._failed_result(*articles[pending[key][0]]) for key in chunk_keys]
+                for key, result in zip(chunk_keys, chunk_results):
+                    complete(key, result)
+                    if result.get('translation_status') == 'completed':
+                        translated.append((key, result))
+            await self._store_persisted(translated)
+        finally:
+            # 未完成（例如被取消）的翻譯以失敗結果通知等待中的呼叫端
+            for key in pending:
+                future = self._in_flight.pop(key, None)
+                if future is not None:
+                    future.set_result(self._failed_result(*articles[pending[key][0]]))
+        
+        for future, indices in waiting.values():
+            # shield：等待者被取消時不影響負責翻譯的呼叫
+            result = await asyncio.shield(future)
+            for i in indices:
+                results[i] = dict(result)
+        return results
+    
+    async def _translate_chunk(self, articles: List[Tuple[str, str]], english: bool = False) -> List[Dict[str, str]]:
+        """
+        以單一請求翻譯一批文章；回應中缺少的文章改為逐篇翻譯
+        
+        english 為 True 時整批皆為純英文文章，使用只產生中文版本的提示
+        """
+        if len(articles) == 1:
+            return [await self._translate_single(*articles[0])]
+        
+        # orjson 直接輸出 UTF-8（不跳脫中文字元），提示內容較短也較快
+        user_prompt = orjson.dumps(
+            [{"id": i, "title": title, "content": content} for i, (title, content) in enumerate(articles)]
+        ).decode()
+        max_tokens = min(_MAX_OUTPUT_TOKENS, max(_MIN_OUTPUT_TOKENS, sum(
+            _estimate_output_tokens(title, content, english) for title, content in articles
+        )))
+        
+        translated: Optional[Dict[int, Dict[str, str]]] = None
+        for attempt in range(self.max_retries):
+            try:
+                await self._rate_limit_wait()
+                
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        _EN_BATCH_SYSTEM_MESSAGE if english else _BATCH_SYSTEM_MESSAGE,
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=0.3,
+                    timeout=_request_timeout(max_tokens),
+                    response_format={"type": "json_object"}
+                )
+                
+                items = orjson.loads(response.choices[0].message.content).get("articles", [])
+                translated = {item["id"]: item for item in items if isinstance(item, dict) and "id" in item}
+                break
+                
+            except _TERMINAL_ERRORS as e:
+                logger.error(f"Batch translation failed with non-retryable error: {e}")
+                break
+            except Exception as e:
+                logger.warning(f"Batch translation attempt {attempt + 1} failed: {e}")
+                if attempt < self.max_retries - 1:
+                    await self._retry_wait(attempt)
+                else:
+                    logger.error(f"Batch translation failed after {self.max_retries} attempts: {e}")
+        
+        if translated is None:
+            return [self._failed_result(title, content) for title, content in articles]
+        
+        results = []
+        for i, (title, content) in enumerate(articles):
+            result = translated.get(i)
+            if result is None:
+                logger.warning(f"Batch response missing article {i}, translating it separately")
+                result = await self._translate_single(title, content)
+            else:
+                result.pop("id", None)
+                if english:
+                    _fill_english_source(result, title, content)
+                result['translation_status'] = 'completed'
+            results.append(result)
+        return results
     
     async def translate_article(self, title: str, content: str) -> Dict[str, str]:
         """
@@ -160,38 +564,35 @@ class TranslationService:
     
     async def batch_translate_articles(self, articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
-        批次翻譯多篇文章
+        批次翻譯多篇文章（多篇文章合併為單一請求，請求之間以有限的並發同時送出）
+        
+        資料庫中已完成所有語言翻譯的文章（以link判斷）不再送出翻譯
         
         Args:
             articles: 文章列表，每個包含title、content和link
             
         Returns:
-            翻譯結果列表
+            尚未翻譯的文章的翻譯結果列表（與輸入順序相同）
         """
-        results = []
+        try:
+            translated_links = await fully_translated_links([article.get('link') for article in articles])
+        except Exception as e:
+            logger.warning(f"Failed to check translated articles: {e}")
+            translated_links = set()
+        if translated_links:
+            logger.info(f"Skipping {len(translated_links)} already translated articles")
+            articles = [article for article in articles if article.get('link') not in translated_links]
         
-        for i, article in enumerate(articles):
-            logger.info(f"Translating article {i + 1}/{len(articles)}: {article.get('title', '')[:50]}...")
-            
-            try:
-                result = await self.translate_article(
-                    article.get('title', ''),
-                    article.get('summary', article.get('content', ''))  # 使用summary作為content
-                )
-                result['article_link'] = article.get('link')  # 使用link而不是id
-                results.append(result)
-                
-                # 批次處理間隔
-                if i < len(articles) - 1:
-                    await asyncio.sleep(0.5)
-                    
-            except Exception as e:
-                logger.error(f"Failed to translate article {i + 1}: {e}")
-                results.append({
-                    'article_link': article.get('link'),
-                    'translation_status': 'failed',
-                    'error': str(e)
-                })
+        logger.info(f"Translating {len(articles)} articles in batches")
+        translations = await self.translate_batch([
+            (article.get('title', ''), article.get('summary', article.get('content', '')))  # 使用summary作為content
+            for article in articles
+        ])
+        
+        results = []
+        for article, result in zip(articles, translations):
+            result['article_link'] = article.get('link')  # 使用link而不是id
+            results.append(result)
         
         return results
 
@@ -205,6 +606,11 @@ def get_translation_service() -> TranslationService:
         _translation_service = TranslationService()
     return _translation_service
 
+async def close_translation_service() -> None:
+    """關閉翻譯服務實例的連線（應用程式關閉時呼叫）"""
+    if _translation_service is not None:
+        await _translation_service.aclose()
+
 async def translate_article_content(title: str, content: str) -> Dict[str, str]:
     """
     翻譯文章內容的便利函數
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+import orjson
+
+from app import translation_service
+from app.translation_service import TranslationService
+
+# 非串流回應的產生速度下限（tokens/秒）；gpt-4o-mini 實際速度通常高於此值
+_SLOW_GENERATION_TOKENS_PER_SECOND = 50.0
+
+
+class _RecordingCompletions:
+    """記錄呼叫參數並回傳空翻譯結果的假 chat.completions"""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        items = orjson.loads(kwargs["messages"][1]["content"])
+        body = {"articles": [{"id": item["id"], "original_language": "zh-tw"} for item in items]}
+        message = SimpleNamespace(content=orjson.dumps(body).decode())
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class RequestTimeoutTest(unittest.TestCase):
+    def test_max_size_chunk_timeout_exceeds_generation_time(self) -> None:
+        service = TranslationService(api_key="test")
+        completions = _RecordingCompletions()
+        service._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        # 一個字數達上限的中文批次
+        size = translation_service._BATCH_TRANSLATION_SIZE
+        chars = translation_service._BATCH_MAX_CHARS // size
+        articles = [("標" * 10, "文" * (chars - 10)) for _ in range(size)]
+        results = asyncio.run(service._translate_chunk(articles))
+
+        self.assertEqual(len(completions.calls), 1)
+        self.assertTrue(all(r["translation_status"] == "completed" for r in results))
+        call = completions.calls[0]
+        self.assertGreater(call["max_tokens"], 10000)
+        generation_seconds = call["max_tokens"] / _SLOW_GENERATION_TOKENS_PER_SECOND
+        self.assertGreater(call["timeout"].read, generation_seconds)
+
+    def test_output_token_cap_timeout_exceeds_generation_time(self) -> None:
+        max_tokens = translation_service._MAX_OUTPUT_TOKENS
+        timeout = translation_service._request_timeout(max_tokens)
+        self.assertGreater(timeout.read, max_tokens / _SLOW_GENERATION_TOKENS_PER_SECOND)
+        self.assertEqual(timeout.connect, translation_service._API_CONNECT_TIMEOUT)
+
+
+if __name__ == "__main__":
+    unittest.main()